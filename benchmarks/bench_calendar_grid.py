@@ -0,0 +1,89 @@
+"""Month-flip benchmark: pooled CalendarGrid vs. destroy/recreate.
+
+Run from the repository root (needs a display, e.g. under Xvfb):
+
+    python benchmarks/bench_calendar_grid.py [FLIPS]
+"""
+
+import calendar
+import os
+import statistics
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taskgui.widgets.calendar_grid import CalendarGrid  # noqa: E402
+
+
+def months(flips):
+    year, month = 2000, 1
+    for _ in range(flips):
+        yield year, month
+        month += 1
+        if month == 13:
+            month = 1
+            year += 1
+
+
+def recreate(frame, buttons, year, month):
+    # The pattern the scripts used before: new widgets on every flip, and
+    # blank-day labels that were never destroyed.
+    for widget in buttons:
+        widget.destroy()
+    buttons.clear()
+    for row, week in enumerate(calendar.monthcalendar(year, month), start=1):
+        for col, day in enumerate(week):
+            if day == 0:
+                tk.Label(frame, text="", width=8).grid(row=row, column=col)
+            else:
+                btn = tk.Button(frame, text=str(day), width=6)
+                btn.grid(row=row, column=col, padx=2, pady=2)
+                buttons.append(btn)
+
+
+def run(root, label, draw, frame, flips):
+    timings = []
+    before = len(frame.winfo_children())
+    for year, month in months(flips):
+        start = time.perf_counter()
+        draw(year, month)
+        root.update_idletasks()
+        timings.append((time.perf_counter() - start) * 1000)
+    after = len(frame.winfo_children())
+
+    print(
+        f"{label:>10}: widgets {before} -> {after}, "
+        f"median {statistics.median(timings):.3f} ms, "
+        f"p99 {sorted(timings)[int(len(timings) * 0.99) - 1]:.3f} ms, "
+        f"max {max(timings):.3f} ms"
+    )
+
+
+def main():
+    flips = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as exc:
+        sys.exit(f"No display available: {exc}")
+    root.withdraw()
+
+    pooled_frame = tk.Frame(root)
+    pooled_frame.pack()
+    grid = CalendarGrid(pooled_frame, lambda day: None,
+                        button_options={"width": 6}, grid_options={"padx": 2, "pady": 2})
+    today = lambda day: {"bg": "lightblue"} if day == 15 else None
+    run(root, "pooled", lambda y, m: grid.show(y, m, today), pooled_frame, flips)
+
+    legacy_frame = tk.Frame(root)
+    legacy_frame.pack()
+    buttons = []
+    run(root, "recreate", lambda y, m: recreate(legacy_frame, buttons, y, m), legacy_frame, flips)
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Memory benchmark: planner tasks as dicts vs. ``__slots__`` records.
+
+Builds the same tasks both ways, the dicts as ``json.load`` would produce
+them, and reports the traced allocation per task. Headless:
+
+    python benchmarks/bench_records.py [COUNT]
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taskgui.core.records import PlannerTask  # noqa: E402
+
+CATEGORIES = ["Work", "Study", "Personal", "Linux"]
+PRIORITIES = ["High", "Normal", "Low"]
+STATUSES = ["Pending", "Done"]
+
+
+def sample_json(count):
+    # Round-trip through JSON so the dicts own separate key and label strings,
+    # like a freshly loaded planner file
+    rows = [
+        {
+            "id": f"{i:032x}",
+            "time": f"{i % 24:02d}:{i % 60:02d}",
+            "task": f"Task number {i}",
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "priority": PRIORITIES[i % len(PRIORITIES)],
+            "status": STATUSES[i % len(STATUSES)],
+        }
+        for i in range(count)
+    ]
+    return json.dumps(rows)
+
+
+def measure(label, build, count):
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = build()
+    elapsed = time.perf_counter() - start
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{label:>8}: {size / count:7.1f} B/task retained, "
+        f"peak {peak / 2**20:8.1f} MiB, built in {elapsed:.2f} s"
+    )
+    del data
+    return size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    text = sample_json(count)
+
+    dicts = measure("dicts", lambda: json.loads(text), count)
+    records = measure(
+        "records",
+        lambda: [PlannerTask.from_dict(data, "2026-1-5") for data in json.loads(text)],
+        count,
+    )
+    print(f"records use {records / dicts:.0%} of the dict footprint")
+
+
+if __name__ == "__main__":
+    main()
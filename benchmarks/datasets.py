@@ -0,0 +1,69 @@
+"""Synthetic, reproducible data for the benchmarks.
+
+Every generator takes a task count and a seed and spreads the records over
+``years`` years ending in 2026, so the same arguments always give the same
+files and results can be compared between commits.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+CATEGORIES = ["Work", "Study", "Personal", "Linux"]
+PRIORITIES = ["High", "Normal", "Low"]
+STATUSES = ["Pending", "Done"]
+WORDS = (
+    "review deploy write fix plan call email read backup update test meet "
+    "draft kernel server report budget invoice garden groceries gym"
+).split()
+
+# Records are spread over the years up to and including this day
+LAST_DAY = datetime(2026, 12, 31)
+
+
+def _days(rng, count, years):
+    span = 365 * years
+    for _ in range(count):
+        yield LAST_DAY - timedelta(days=rng.randrange(span))
+
+
+def _text(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5)))
+
+
+def planner_tasks(count, years=5, seed=1):
+    """A LinuxCalendarApp data dict: ``{"2026-1-5": [task, ...]}``."""
+    rng = random.Random(seed)
+    data = {}
+    for i, day in enumerate(_days(rng, count, years)):
+        data.setdefault(f"{day.year}-{day.month}-{day.day}", []).append({
+            "id": f"{i:032x}",
+            "time": f"{rng.randrange(24):02d}:{rng.randrange(0, 60, 5):02d}",
+            "task": _text(rng),
+            "category": rng.choice(CATEGORIES),
+            "priority": rng.choice(PRIORITIES),
+            "status": rng.choice(STATUSES),
+        })
+    return data
+
+
+def todo_items(count, seed=1):
+    """A TaskEase task list."""
+    rng = random.Random(seed)
+    return [
+        {"title": f"{_text(rng)} {i}", "note": _text(rng), "done": rng.random() < 0.3}
+        for i in range(count)
+    ]
+
+
+def calendar_events(count, years=5, seed=1):
+    """An alarm-calendar events dict keyed ``"2026-01-05 09:05"``."""
+    rng = random.Random(seed)
+    events = {}
+    for day in _days(rng, count, years):
+        when = day.replace(hour=rng.randrange(24), minute=rng.randrange(60))
+        events[when.strftime("%Y-%m-%d %H:%M")] = {
+            "text": _text(rng),
+            "color": "#90caf9",
+            "alerted": when < LAST_DAY - timedelta(days=30),
+        }
+    return events
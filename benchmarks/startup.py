@@ -0,0 +1,145 @@
+"""Startup benchmark for the ``python -m taskgui`` front ends.
+
+Each app is started ``--runs`` times in a fresh empty directory with
+``-X importtime`` and the launcher's ``--first-frame`` option, and the
+report records, per app, the medians of:
+
+- ``wall_ms``: process start to exit (interpreter start-up included);
+- ``first_frame_ms``: launcher start to the first window drawn;
+- ``import_ms``: time spent importing, from ``-X importtime``;
+
+plus the slowest top-level imports. Time to first frame needs a display
+(e.g. run under Xvfb); without one it is left null and the import
+numbers are still recorded.
+
+    python benchmarks/startup.py [--apps calendar,planner] [--runs 5]
+                                 [--output startup.json]
+    python benchmarks/startup.py --baseline startup.json [--threshold 1.2]
+                                 [--budget-ms 800]
+
+With ``--baseline`` the run exits non-zero if any median is more than
+``threshold`` times the baseline's, or a first frame exceeds ``budget-ms``.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from taskgui.__main__ import APPS  # noqa: E402
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+FIRST_FRAME_LINE = re.compile(r"first frame: ([\d.]+) ms")
+METRICS = ("wall_ms", "first_frame_ms", "import_ms")
+
+
+def start_once(app):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    with tempfile.TemporaryDirectory(prefix="taskgui-startup-") as cwd:
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "taskgui", app, "--first-frame"],
+            cwd=cwd, env=env, capture_output=True, text=True, timeout=60,
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+
+    imports = []   # (cumulative µs, name) of top-level imports
+    first_frame = None
+    error = None
+    for line in proc.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            if not match.group(3):
+                imports.append((int(match.group(2)), match.group(4)))
+            continue
+        match = FIRST_FRAME_LINE.search(line)
+        if match:
+            first_frame = float(match.group(1))
+        elif line.strip():
+            error = line.strip()   # keep the last line, e.g. a TclError
+    return {
+        "wall_ms": wall_ms,
+        "first_frame_ms": first_frame,
+        "import_ms": sum(us for us, _ in imports) / 1000,
+        "imports": imports,
+        "error": error if first_frame is None else None,
+    }
+
+
+def median(values):
+    values = [v for v in values if v is not None]
+    return round(statistics.median(values), 1) if values else None
+
+
+def measure(app, runs):
+    results = [start_once(app) for _ in range(runs)]
+    slowest = sorted(results[-1]["imports"], reverse=True)[:5]
+    return {
+        **{metric: median(r[metric] for r in results) for metric in METRICS},
+        "slowest_imports": [{"module": name, "ms": us / 1000} for us, name in slowest],
+        "error": results[-1]["error"],
+    }
+
+
+def regressions(report, baseline, threshold, budget_ms):
+    failures = []
+    for app, result in report.items():
+        before = baseline.get(app, {})
+        for metric in METRICS:
+            old, new = before.get(metric), result[metric]
+            if old and new is not None and new > old * threshold:
+                failures.append(f"{app} {metric}: {old} -> {new} ms")
+        first_frame = result["first_frame_ms"]
+        if budget_ms is not None and first_frame is not None and first_frame > budget_ms:
+            failures.append(f"{app} first frame {first_frame} ms over the {budget_ms} ms budget")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", default=",".join(APPS))
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="report to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    parser.add_argument("--budget-ms", type=float)
+    args = parser.parse_args()
+
+    report = {}
+    for app in args.apps.split(","):
+        report[app] = result = measure(app, args.runs)
+        frame = "n/a" if result["first_frame_ms"] is None else f"{result['first_frame_ms']:.1f} ms"
+        print(
+            f"{app:>10}: first frame {frame:>10}, imports {result['import_ms']:7.1f} ms, "
+            f"wall {result['wall_ms']:7.1f} ms",
+            file=sys.stderr,
+        )
+        if result["error"]:
+            print(f"{'':>10}  ({result['error']})", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    if baseline or args.budget_ms is not None:
+        failures = regressions(report, baseline, args.threshold, args.budget_ms)
+        for failure in failures:
+            print("REGRESSION " + failure, file=sys.stderr)
+        sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
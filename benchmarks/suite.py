@@ -0,0 +1,294 @@
+"""Headless benchmark suite for the code behind the GUIs' hot paths.
+
+Times loading, saving, calendar redraws, task-table refreshes, search and
+reminder scans on synthetic data, and records the peak memory each run
+allocates. Nothing here opens a window: the Treeview is replaced by a stub
+that accepts the same calls, so it runs on machines without a display.
+
+Run from the repository root:
+
+    python benchmarks/suite.py [--sizes 1000,100000,1000000] [--repeat 5]
+                               [--only planner] [--output report.json]
+    python benchmarks/suite.py --compare old.json new.json [--threshold 1.25]
+
+The JSON report is stable between runs with the same arguments, so two
+reports from different commits can be compared with ``--compare``, which
+exits non-zero when a case got slower than ``threshold`` times.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import datasets  # noqa: E402
+from taskgui.core.events import EventBook  # noqa: E402
+from taskgui.core.scheduler import ReminderScheduler  # noqa: E402
+from taskgui.core.storage import atomic_write_json, atomic_write_text  # noqa: E402
+from taskgui.core.taskstore import JsonTaskStore, ShardedTaskStore  # noqa: E402
+from taskgui.core.todo import TodoList  # noqa: E402
+from taskgui.widgets.tree_sync import TreeviewSync  # noqa: E402
+
+DEFAULT_SIZES = (1000, 100_000)
+NOW = datetime(2026, 12, 1, 12, 0)
+SEARCH_QUERIES = ["re", "review", "fix ser", "gym 12", "zzz"]
+
+
+class NullTree:
+    """Accepts the Treeview calls TreeviewSync makes and does nothing."""
+
+    def delete(self, *iids):
+        pass
+
+    def detach(self, *iids):
+        pass
+
+    def insert(self, parent, index, iid=None, values=()):
+        return iid
+
+    def move(self, iid, parent, index):
+        pass
+
+    def item(self, iid, **options):
+        pass
+
+
+# ---- cases: each takes the prepared Fixture and returns a setup callable;
+# ---- setup() returns the zero-argument function that is timed.
+
+def planner_load_json(fx):
+    return lambda: lambda: JsonTaskStore(fx.planner_json)
+
+
+def planner_load_shards(fx):
+    # Cold start with month shards: only the visible month is read
+    return lambda: lambda: ShardedTaskStore(fx.planner_shards).month_days(2026, 12)
+
+
+def planner_save_snapshot(fx):
+    return lambda: fx.planner.snapshot
+
+
+def planner_save_serialize(fx):
+    # The part of a save that runs on the writer thread
+    render = fx.planner.snapshot()
+    return lambda: render
+
+
+def planner_save_write(fx):
+    text = fx.planner.snapshot()()
+    path = os.path.join(fx.tmp, "planner-copy.json")
+    return lambda: lambda: atomic_write_text(path, text)
+
+
+def planner_draw_calendar(fx):
+    return lambda: lambda: fx.planner.month_days(2026, 6)
+
+
+def planner_refresh_tree(fx):
+    day = fx.busiest_day
+
+    def rows():
+        return ((t.id, t.row()) for t in fx.planner.day_tasks(day))
+
+    def setup():
+        sync = TreeviewSync(NullTree())
+        sync.sync(rows())
+        # One task changes status, as after "Mark Done"
+        fx.planner.toggle_done(fx.planner.day_tasks(day)[0].id)
+        return lambda: sync.sync(rows())
+    return setup
+
+
+def todo_load(fx):
+    return lambda: lambda: TodoList().load(fx.todo_json)
+
+
+def todo_search(fx):
+    def run():
+        for query in SEARCH_QUERIES:
+            fx.todo.search(query)
+    return lambda: run
+
+
+def events_load(fx):
+    def run():
+        book = EventBook(fx.events_json)
+        book.load(NOW)
+        book.close()
+    return lambda: run
+
+
+def reminders_rebuild(fx):
+    return lambda: lambda: ReminderScheduler().load(fx.events.events, NOW)
+
+
+def reminders_pop_due(fx):
+    def setup():
+        scheduler = ReminderScheduler()
+        scheduler.load(fx.events.events, NOW)
+        # A day's worth of alarms fall due, e.g. after a suspend
+        return lambda: scheduler.pop_due(NOW.replace(day=2))
+    return setup
+
+
+CASES = [
+    ("planner.load_json", planner_load_json),
+    ("planner.load_shards", planner_load_shards),
+    ("planner.save_snapshot", planner_save_snapshot),
+    ("planner.save_serialize", planner_save_serialize),
+    ("planner.save_write", planner_save_write),
+    ("planner.draw_calendar", planner_draw_calendar),
+    ("planner.refresh_tree", planner_refresh_tree),
+    ("todo.load", todo_load),
+    ("todo.search", todo_search),
+    ("events.load", events_load),
+    ("reminders.rebuild", reminders_rebuild),
+    ("reminders.pop_due", reminders_pop_due),
+]
+
+
+class Fixture:
+    """Files and loaded objects for one dataset size, built once."""
+
+    def __init__(self, size, tmp):
+        self.size = size
+        self.tmp = tmp
+
+        self.planner_json = os.path.join(tmp, "planner.json")
+        planner = datasets.planner_tasks(size)
+        self.busiest_day = max(planner.items(), key=lambda item: len(item[1]))[0]
+        atomic_write_json(self.planner_json, planner)
+        del planner
+        # The first load respells keys and rewrites the file; time steady state
+        self.planner = JsonTaskStore(self.planner_json)
+        self.planner_shards = os.path.join(tmp, "planner-shards")
+        ShardedTaskStore(self.planner_shards, legacy_path=self.planner_json)
+
+        self.todo_json = os.path.join(tmp, "todo.json")
+        atomic_write_json(self.todo_json, datasets.todo_items(size))
+        self.todo = TodoList()
+        self.todo.load(self.todo_json)
+
+        self.events_json = os.path.join(tmp, "events.json")
+        atomic_write_json(self.events_json, datasets.calendar_events(size))
+        self.events = EventBook(self.events_json)
+        self.events.load(NOW)
+        self.events.close()
+
+
+def measure(setup, repeat):
+    timings = []
+    for _ in range(repeat):
+        run = setup()
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    # Memory in a separate run: tracing slows everything down
+    run = setup()
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(sizes, repeat, only=None):
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix="taskgui-bench-") as tmp:
+            print(f"preparing {size} records ...", file=sys.stderr)
+            fixture = Fixture(size, tmp)
+            for name, case in CASES:
+                if only and not name.startswith(only):
+                    continue
+                result = {"case": name, "size": size, **measure(case(fixture), repeat)}
+                print(
+                    f"{name:>24} {size:>9}: median {result['median_ms']:10.3f} ms, "
+                    f"peak {result['peak_kib']:10.1f} KiB",
+                    file=sys.stderr,
+                )
+                results.append(result)
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(old_path, new_path, threshold):
+    with open(old_path) as f:
+        old = {(r["case"], r["size"]): r for r in json.load(f)["results"]}
+    with open(new_path) as f:
+        new = json.load(f)["results"]
+
+    regressions = 0
+    for result in new:
+        before = old.get((result["case"], result["size"]))
+        if before is None or not before["median_ms"]:
+            continue
+        ratio = result["median_ms"] / before["median_ms"]
+        flag = "  SLOWER" if ratio > threshold else ""
+        regressions += bool(flag)
+        print(
+            f"{result['case']:>24} {result['size']:>9}: "
+            f"{before['median_ms']:10.3f} -> {result['median_ms']:10.3f} ms "
+            f"({ratio:5.2f}x){flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated record counts (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", help="run only cases whose name starts with this")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) else 0)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    report = run_suite(sizes, args.repeat, args.only)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,21 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, colorchooser
+from tkinter import ttk, messagebox
 import calendar
+import logging
 from datetime import datetime
-import json
-import os
 
-# Try Windows sound, else fallback
-try:
-    import winsound
-    SOUND_AVAILABLE = True
-except ImportError:
-    SOUND_AVAILABLE = False
+from taskgui.core.events import EventBook
+from taskgui.core.recurrence import Rule
+from taskgui.core.scheduler import parse_event_key
+from taskgui.widgets.calendar_grid import CalendarGrid
+from taskgui.widgets.clock import Clock
+from taskgui.widgets.instrument import profile_session
+from taskgui.widgets.watchdog import JankWatchdog
 
 
 DATA_FILE = "events.json"
 DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+REPEAT_CHOICES = ["Never", "Daily", "Weekly", "Monthly", "Yearly"]
 
 
 class CalendarApp(tk.Tk):
@@ -31,19 +32,34 @@ class CalendarApp(tk.Tk):
         self.current_month = self.today.month
         self.selected_day = None
 
-        self.events = {}
+        # Events, their indexes and pending alarms (headless, see taskgui.core)
+        self.book = EventBook(DATA_FILE)
         self.load_events()
 
         self.status_text = tk.StringVar(value="Ready")
         self.time_text = tk.StringVar()
+        self.jank_text = tk.StringVar()
 
         self.create_header()
         self.create_main_layout()
         self.create_status_bar()
 
+        # Measures every self.after() from here on; stats go to the status bar.
+        # Callbacks late by, or handlers blocking for, over the watchdog's
+        # JANK_THRESHOLD_MS are logged with the blocking stack
+        self.watchdog = JankWatchdog(self, on_stats=self.jank_text.set).start()
+
         self.draw_calendar()
-        self.update_current_time()   # ⏰ live clock
-        self.check_reminders()       # 🔔 alarm loop
+
+        # One timer on second boundaries drives the ⏰ live clock, the
+        # 🔔 alarm check and moving the "today" highlight at midnight
+        self.clock = Clock(self)
+        self.clock.show(self.time_text, "%I:%M:%S %p")
+        self.clock.each_second(self.check_reminders)
+        self.clock.each_day(self.new_day)
+        self.clock.start()
+
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     # ================= HEADER =================
 
@@ -88,45 +104,34 @@ class CalendarApp(tk.Tk):
         for col, day in enumerate(DAY_NAMES):
             ttk.Label(self.calendar_frame, text=day, width=8).grid(row=0, column=col)
 
-        self.day_buttons = []
+        self.day_grid = CalendarGrid(
+            self.calendar_frame,
+            self.select_day,
+            button_options={"width": 6},
+            grid_options={"padx": 2, "pady": 2}
+        )
 
     def draw_calendar(self):
-        for widget in self.day_buttons:
-            widget.destroy()
-        self.day_buttons.clear()
-
         self.month_label.config(
             text=f"{calendar.month_name[self.current_month]} {self.current_year}"
         )
 
-        month_days = calendar.monthcalendar(self.current_year, self.current_month)
-
-        row = 1
-        for week in month_days:
-            col = 0
-            for day in week:
-                if day == 0:
-                    ttk.Label(self.calendar_frame, text="", width=8).grid(row=row, column=col)
-                else:
-                    btn = tk.Button(
-                        self.calendar_frame,
-                        text=str(day),
-                        width=6,
-                        command=lambda d=day: self.select_day(d)
-                    )
-
-                    if (
-                        day == self.today.day and
-                        self.current_month == self.today.month and
-                        self.current_year == self.today.year
-                    ):
-                        btn.config(bg="lightblue")
-
-                    btn.grid(row=row, column=col, padx=2, pady=2)
-                    self.day_buttons.append(btn)
-
-                col += 1
-            row += 1
+        # Only this month's events are visited
+        self.month_colors = self.book.month_colors(self.current_year, self.current_month)
+
+        self.day_grid.show(self.current_year, self.current_month, self.day_style)
+
+    def day_style(self, day):
+        if (
+            day == self.today.day and
+            self.current_month == self.today.month and
+            self.current_year == self.today.year
+        ):
+            return {"bg": "lightblue"}
+        # Days with events take the colour of their first event
+        if day in self.month_colors:
+            return {"bg": self.month_colors[day]}
+        return None
 
     # ================= EVENT PANEL =================
 
@@ -153,6 +158,11 @@ class CalendarApp(tk.Tk):
         self.ampm_box.set("AM")
         self.ampm_box.grid(row=0, column=5, padx=5)
 
+        ttk.Label(time_frame, text="Repeat").grid(row=1, column=0, pady=(5, 0))
+        self.repeat_box = ttk.Combobox(time_frame, values=REPEAT_CHOICES, width=8, state="readonly")
+        self.repeat_box.set("Never")
+        self.repeat_box.grid(row=1, column=1, columnspan=2, sticky="w", padx=5, pady=(5, 0))
+
         ttk.Label(self.event_frame, text="Description").pack(anchor="w")
         self.event_text = tk.Text(self.event_frame, width=35, height=6)
         self.event_text.pack(pady=5)
@@ -176,66 +186,82 @@ class CalendarApp(tk.Tk):
             messagebox.showwarning("Warning", "Select a date first")
             return
 
-        hour = self.hour_spin.get()
-        minute = self.minute_spin.get()
-        ampm = self.ampm_box.get()
+        key = self.selected_key()
+        if key is None:
+            return
         text = self.event_text.get("1.0", tk.END).strip()
 
         if not text:
             messagebox.showwarning("Warning", "Event text is empty")
             return
 
-        key = f"{self.current_year}-{self.current_month:02d}-{self.selected_day:02d} {hour}:{minute} {ampm}"
+        repeat = self.repeat_box.get()
+        rule = Rule(repeat.lower()) if repeat != "Never" else None
+        self.book.save(key, text, self.selected_color, rule)
 
-        self.events[key] = {
-            "text": text,
-            "color": self.selected_color,
-            "alerted": False
-        }
-
-        self.save_events()
         self.status_text.set("Event saved with alarm")
+        self.draw_calendar()
 
     def delete_event(self):
-        hour = self.hour_spin.get()
-        minute = self.minute_spin.get()
-        ampm = self.ampm_box.get()
+        if not self.selected_day:
+            return
+        key = self.selected_key()
+        if key is None:
+            return
 
-        key = f"{self.current_year}-{self.current_month:02d}-{self.selected_day:02d} {hour}:{minute} {ampm}"
+        # A later occurrence of a recurring event only skips that day
+        result = self.book.delete(key)
+        if result is None:
+            return
+        if result == "skipped":
+            self.status_text.set("Occurrence removed from the series")
+        self.event_text.delete("1.0", tk.END)
+        self.draw_calendar()
 
-        if key in self.events:
-            del self.events[key]
-            self.save_events()
-            self.event_text.delete("1.0", tk.END)
+    def selected_key(self):
+        # The spinboxes accept typed text, so "13" or "60" can get this far
+        key = self.event_key(self.hour_spin.get(), self.minute_spin.get(), self.ampm_box.get())
+        if parse_event_key(key) is None:
+            messagebox.showwarning("Warning", "Enter a time from 1:00 to 12:59")
+            return None
+        return key
 
-    # ================= REMINDER + SOUND =================
+    def event_key(self, hour, minute, ampm):
+        # EventBook respells this as the canonical "YYYY-MM-DD HH:MM"
+        return f"{self.current_year}-{self.current_month:02d}-{self.selected_day:02d} {hour}:{minute} {ampm}"
 
-    def check_reminders(self):
-        now = datetime.now().strftime("%Y-%m-%d %I:%M %p")
+    # ================= REMINDER + SOUND =================
 
-        for key, event in self.events.items():
-            if key == now and not event["alerted"]:
-                self.play_alarm_sound()
-                messagebox.showinfo("Reminder", event["text"])
-                event["alerted"] = True
-                self.save_events()
+    def check_reminders(self, now):
+        # A peek at the earliest alarm each second; wall-clock jumps are
+        # caught on the next tick
+        due = self.book.next_due()
+        if due is None or due > now:
+            return
 
-        self.after(1000, self.check_reminders)
+        due_keys = self.book.fire_due(now)
+        if due_keys:
+            self.play_alarm_sound()
+            messagebox.showinfo("Reminder", self.book.format_reminders(due_keys))
 
     def play_alarm_sound(self):
-        if SOUND_AVAILABLE:
-            for _ in range(3):
-                winsound.Beep(1000, 300)
-        else:
+        # Windows sound if there is one, looked up on the first alarm
+        try:
+            import winsound
+        except ImportError:
             self.bell()
+            return
+        for _ in range(3):
+            winsound.Beep(1000, 300)
 
     # ================= UTILITIES =================
 
-    def update_current_time(self):
-        self.time_text.set(datetime.now().strftime("%I:%M:%S %p"))
-        self.after(1000, self.update_current_time)
+    def new_day(self, now):
+        self.today = now
+        self.draw_calendar()
 
     def choose_color(self):
+        from tkinter import colorchooser  # only loaded if a colour is picked
         color = colorchooser.askcolor()[1]
         if color:
             self.selected_color = color
@@ -255,19 +281,26 @@ class CalendarApp(tk.Tk):
         self.draw_calendar()
 
     def load_events(self):
-        if os.path.exists(DATA_FILE):
-            with open(DATA_FILE, "r") as f:
-                self.events = json.load(f)
+        self.book.load()
 
-    def save_events(self):
-        with open(DATA_FILE, "w") as f:
-            json.dump(self.events, f, indent=4)
+    def on_close(self):
+        # Fold the change log into events.json before exiting
+        self.clock.stop()
+        self.watchdog.stop()
+        self.book.close()
+        self.destroy()
 
     def create_status_bar(self):
-        ttk.Label(self, textvariable=self.status_text, relief="sunken", anchor="w")\
-            .pack(fill="x", side="bottom")
+        bar = ttk.Frame(self, relief="sunken")
+        bar.pack(fill="x", side="bottom")
+        ttk.Label(bar, textvariable=self.status_text, anchor="w").pack(side="left", fill="x", expand=True)
+        ttk.Label(bar, textvariable=self.jank_text, anchor="e", foreground="gray")\
+            .pack(side="right", padx=5)
 
 
 if __name__ == "__main__":
-    app = CalendarApp()
-    app.mainloop()
+    logging.basicConfig(format="%(asctime)s %(name)s: %(message)s")
+    # --profile[=out.prof|out.json] or TASKGUI_PROFILE times every handler
+    with profile_session():
+        app = CalendarApp()
+        app.mainloop()
@@ -1,10 +1,14 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, colorchooser
+from tkinter import ttk, messagebox
 import calendar
 from datetime import datetime
-import json
 import os
 
+from taskgui.core.exporters import event_items, export_chunks, is_ics, write_export
+from taskgui.core.sync import SyncedRecords
+from taskgui.widgets.calendar_grid import CalendarGrid
+from taskgui.widgets.live_sync import LiveSync
+
 
 # ==========================
 # Constants
@@ -36,9 +40,13 @@ class CalendarApp(tk.Tk):
         self.current_month = self.today.month
         self.selected_day = None
 
-        # Event storage
-        self.events = {}
+        # Event storage, shared with any other window open on DATA_FILE:
+        # their saves are merged in per event, and ours under a file lock
+        self.sync = SyncedRecords(DATA_FILE)
+        self.live = LiveSync(self, self.sync, self.events_changed,
+                             report=lambda msg: self.status_text.set(msg))
         self.load_events()
+        self.shown_text = ""
 
         # UI Variables
         self.status_text = tk.StringVar(value="Ready")
@@ -52,6 +60,9 @@ class CalendarApp(tk.Tk):
         # Initial draw
         self.draw_calendar()
 
+        self.live.start()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
 
     # ==========================
     # Menu
@@ -61,9 +72,11 @@ class CalendarApp(tk.Tk):
         menubar = tk.Menu(self)
 
         file_menu = tk.Menu(menubar, tearoff=0)
-        file_menu.add_command(label="Save", command=self.save_events)
+        file_menu.add_command(label="Save", command=self.save_now)
+        file_menu.add_command(label="Export...", command=self.export_events)
+        file_menu.add_command(label="Export Month...", command=lambda: self.export_events(month_only=True))
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.quit)
+        file_menu.add_command(label="Exit", command=self.on_close)
 
         help_menu = tk.Menu(menubar, tearoff=0)
         help_menu.add_command(label="About", command=self.show_about)
@@ -125,57 +138,39 @@ class CalendarApp(tk.Tk):
             lbl = ttk.Label(self.calendar_frame, text=day, width=8, anchor="center")
             lbl.grid(row=0, column=col, pady=5)
 
-        self.day_buttons = []
+        # Day buttons are created once and reused for every month
+        self.day_grid = CalendarGrid(
+            self.calendar_frame,
+            self.select_day,
+            button_options={"width": 6},
+            grid_options={"padx": 2, "pady": 2}
+        )
 
 
     def draw_calendar(self):
-        # Clear old buttons
-        for widget in self.day_buttons:
-            widget.destroy()
-        self.day_buttons.clear()
-
         # Update month label
         self.month_label.config(
             text=f"{calendar.month_name[self.current_month]} {self.current_year}"
         )
 
-        # Get month layout
-        month_days = calendar.monthcalendar(self.current_year, self.current_month)
-
-        row = 1
-        for week in month_days:
-            col = 0
-            for day in week:
-                if day == 0:
-                    lbl = ttk.Label(self.calendar_frame, text="", width=8)
-                    lbl.grid(row=row, column=col)
-                    self.day_buttons.append(lbl)
-                else:
-                    btn = tk.Button(
-                        self.calendar_frame,
-                        text=str(day),
-                        width=6,
-                        command=lambda d=day: self.select_day(d)
-                    )
-
-                    # Highlight today
-                    if (
-                        day == self.today.day and
-                        self.current_month == self.today.month and
-                        self.current_year == self.today.year
-                    ):
-                        btn.config(bg="lightblue")
-
-                    # Highlight event days
-                    date_key = self.format_date(day)
-                    if date_key in self.events:
-                        btn.config(bg=self.events[date_key]["color"])
-
-                    btn.grid(row=row, column=col, padx=2, pady=2)
-                    self.day_buttons.append(btn)
-
-                col += 1
-            row += 1
+        self.day_grid.show(self.current_year, self.current_month, self.day_style)
+
+
+    def day_style(self, day):
+        # Highlight event days
+        date_key = self.format_date(day)
+        if date_key in self.events:
+            return {"bg": self.events[date_key]["color"]}
+
+        # Highlight today
+        if (
+            day == self.today.day and
+            self.current_month == self.today.month and
+            self.current_year == self.today.year
+        ):
+            return {"bg": "lightblue"}
+
+        return None
 
 
     # ==========================
@@ -235,6 +230,7 @@ class CalendarApp(tk.Tk):
         if date_key in self.events:
             self.event_text.insert(tk.END, self.events[date_key]["text"])
             self.selected_color = self.events[date_key]["color"]
+        self.shown_text = self.event_text.get("1.0", tk.END).strip()
 
         self.status_text.set(f"Selected date {date_key}")
 
@@ -255,6 +251,8 @@ class CalendarApp(tk.Tk):
             "text": text,
             "color": self.selected_color
         }
+        self.sync.touch(date_key)
+        self.shown_text = text
 
         self.save_events()
         self.draw_calendar()
@@ -269,6 +267,8 @@ class CalendarApp(tk.Tk):
 
         if date_key in self.events:
             del self.events[date_key]
+            self.sync.touch(date_key)
+            self.shown_text = ""
             self.event_text.delete("1.0", tk.END)
             self.save_events()
             self.draw_calendar()
@@ -276,6 +276,7 @@ class CalendarApp(tk.Tk):
 
 
     def choose_color(self):
+        from tkinter import colorchooser  # only loaded if a colour is picked
         color = colorchooser.askcolor(title="Choose Event Color")
         if color[1]:
             self.selected_color = color[1]
@@ -316,14 +317,63 @@ class CalendarApp(tk.Tk):
 
 
     def load_events(self):
-        if os.path.exists(DATA_FILE):
-            with open(DATA_FILE, "r") as file:
-                self.events = json.load(file)
+        self.events = self.sync.load()
 
 
     def save_events(self):
-        with open(DATA_FILE, "w") as file:
-            json.dump(self.events, file, indent=4)
+        self.live.save()
+
+
+    def save_now(self):
+        self.live.flush()
+        self.status_text.set("Events saved")
+
+
+    def events_changed(self, keys):
+        # Another window saved these events; only their cells are redrawn
+        prefix = f"{self.current_year}-{self.current_month:02d}-"
+        days = {
+            int(key[len(prefix):]) for key in keys
+            if key.startswith(prefix) and key[len(prefix):].isdigit()
+        }
+        self.day_grid.restyle(days, self.day_style)
+
+        if self.selected_day in days:
+            # Unsaved typing in the panel is left alone
+            if self.event_text.get("1.0", tk.END).strip() == self.shown_text:
+                self.select_day(self.selected_day)
+        self.status_text.set("Updated from another window")
+
+
+    def export_events(self, month_only=False):
+        from tkinter import filedialog  # only loaded when exporting
+        path = filedialog.asksaveasfilename(
+            title="Export Events",
+            defaultextension=".ics",
+            filetypes=[("iCalendar", "*.ics"), ("CSV", "*.csv")]
+        )
+        if not path:
+            return
+
+        start = end = None
+        if month_only:
+            last = calendar.monthrange(self.current_year, self.current_month)[1]
+            start, end = self.format_date(1), self.format_date(last)
+
+        # Written chunk by chunk as the events are read
+        try:
+            items = event_items(self.events, start, end, expand=not is_ics(path))
+            write_export(path, export_chunks(items, path))
+        except OSError as e:
+            messagebox.showerror("Export", f"Could not export: {e}")
+            return
+        self.status_text.set(f"Exported to {os.path.basename(path)}")
+
+
+    def on_close(self):
+        # Make sure pending saves reach the disk before exiting
+        self.live.close()
+        self.destroy()
 
 
     def show_about(self):
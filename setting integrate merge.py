@@ -1,14 +1,19 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, colorchooser
+from tkinter import ttk, messagebox
 import calendar
 from datetime import datetime
 import json
 import os
 
+from taskgui.core.events import EventBook
+from taskgui.core.storage import partition_path
+from taskgui.widgets.calendar_grid import CalendarGrid
+from taskgui.widgets.clock import Clock
+
 # ================= FILES =================
 
 USERS_FILE = "users.json"
-EVENTS_FILE = "events.json"
+USER_EVENTS_DIR = "events_by_user"   # one events file (and change log) per account
 
 DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
@@ -21,6 +26,18 @@ def load_users():
     with open(USERS_FILE, "r") as f:
         return json.load(f)
 
+
+def user_events_file(user_email):
+    """The user's own events file; other accounts' files are never opened."""
+    path = partition_path(USER_EVENTS_DIR, user_email)
+    if not os.path.exists(path):
+        # A new account starts empty: the shared events.json records no
+        # owner, so none of its events can be said to be this user's
+        os.makedirs(USER_EVENTS_DIR, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({}, f)
+    return path
+
 # ================= LOGIN WINDOW =================
 
 class LoginWindow(tk.Tk):
@@ -72,6 +89,8 @@ class CalendarApp(tk.Tk):
         self.current_month = self.today.month
         self.selected_day = None
 
+        # Only this account's partition is loaded
+        self.book = EventBook(user_events_file(user_email))
         self.events = {}
         self.load_events()
 
@@ -83,9 +102,15 @@ class CalendarApp(tk.Tk):
         self.create_status_bar()
 
         self.draw_calendar()
-        self.update_time()
-        self.check_reminders()
 
+        # Clock, reminder check and the midnight rollover share one timer
+        self.clock = Clock(self)
+        self.clock.show(self.time_text, "%I:%M:%S %p")
+        self.clock.each_second(self.check_reminders)
+        self.clock.each_day(self.new_day)
+        self.clock.start()
+
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         self.mainloop()
 
     # ================= HEADER =================
@@ -114,36 +139,18 @@ class CalendarApp(tk.Tk):
         for i, day in enumerate(DAY_NAMES):
             ttk.Label(self.calendar_frame, text=day, width=8).grid(row=0, column=i)
 
-        self.buttons = []
+        self.day_grid = CalendarGrid(
+            self.calendar_frame,
+            self.select_day,
+            button_options={"width": 6},
+            grid_options={"padx": 2, "pady": 2}
+        )
 
     # ================= CALENDAR =================
 
     def draw_calendar(self):
-        for btn in self.buttons:
-            btn.destroy()
-        self.buttons.clear()
-
         self.month_label.config(text=f"{calendar.month_name[self.current_month]} {self.current_year}")
-
-        month_days = calendar.monthcalendar(self.current_year, self.current_month)
-
-        row = 1
-        for week in month_days:
-            col = 0
-            for day in week:
-                if day == 0:
-                    ttk.Label(self.calendar_frame, text="", width=8).grid(row=row, column=col)
-                else:
-                    b = tk.Button(
-                        self.calendar_frame,
-                        text=str(day),
-                        width=6,
-                        command=lambda d=day: self.select_day(d)
-                    )
-                    b.grid(row=row, column=col, padx=2, pady=2)
-                    self.buttons.append(b)
-                col += 1
-            row += 1
+        self.day_grid.show(self.current_year, self.current_month)
 
     def select_day(self, day):
         self.selected_day = day
@@ -151,21 +158,33 @@ class CalendarApp(tk.Tk):
 
     # ================= TIME =================
 
-    def update_time(self):
-        self.time_text.set(datetime.now().strftime("%I:%M:%S %p"))
-        self.after(1000, self.update_time)
+    def new_day(self, now):
+        self.today = now
+        self.draw_calendar()
 
     # ================= REMINDER =================
 
-    def check_reminders(self):
-        self.after(1000, self.check_reminders)
+    def check_reminders(self, now):
+        # A peek at this account's earliest alarm each second, as in the
+        # alarm calendar; only due alarms touch the event book
+        due = self.book.next_due()
+        if due is None or due > now:
+            return
+
+        due_keys = self.book.fire_due(now)
+        if due_keys:
+            self.bell()
+            messagebox.showinfo("Reminder", self.book.format_reminders(due_keys))
 
     # ================= FILE =================
 
     def load_events(self):
-        if os.path.exists(EVENTS_FILE):
-            with open(EVENTS_FILE, "r") as f:
-                self.events = json.load(f)
+        self.events = self.book.load()
+
+    def on_close(self):
+        self.clock.stop()
+        self.book.close()
+        self.destroy()
 
     def create_status_bar(self):
         ttk.Label(self, textvariable=self.status_text, relief="sunken", anchor="w")\
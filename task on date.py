@@ -3,6 +3,8 @@ from tkinter import ttk
 import calendar
 from datetime import datetime
 
+from taskgui.widgets.calendar_grid import CalendarGrid
+
 
 class CalendarGUI(tk.Tk):
     def __init__(self):
@@ -47,7 +49,12 @@ class CalendarGUI(tk.Tk):
             lbl.grid(row=0, column=i)
             self.day_labels.append(lbl)
 
-        self.date_buttons = []
+        self.day_grid = CalendarGrid(
+            self.cal_frame,
+            self.select_date,
+            button_options={"width": 4},
+            grid_options={"padx": 1, "pady": 1}
+        )
 
     def create_status_bar(self):
         self.status = tk.StringVar(value="Ready")
@@ -61,45 +68,20 @@ class CalendarGUI(tk.Tk):
         status_bar.pack(fill="x", side="bottom")
 
     def draw_calendar(self):
-        for btn in self.date_buttons:
-            btn.destroy()
-
-        self.date_buttons.clear()
-
         self.month_label.config(
             text=f"{calendar.month_name[self.current_month]} {self.current_year}"
         )
 
-        month_days = calendar.monthcalendar(self.current_year, self.current_month)
-
-        row = 1
-        for week in month_days:
-            col = 0
-            for day in week:
-                if day == 0:
-                    lbl = ttk.Label(self.cal_frame, text="", width=6)
-                    lbl.grid(row=row, column=col)
-                    self.date_buttons.append(lbl)
-                else:
-                    btn = tk.Button(
-                        self.cal_frame,
-                        text=str(day),
-                        width=4,
-                        command=lambda d=day: self.select_date(d)
-                    )
-
-                    if (
-                        day == self.today.day and
-                        self.current_month == self.today.month and
-                        self.current_year == self.today.year
-                    ):
-                        btn.config(bg="lightblue")
-
-                    btn.grid(row=row, column=col, padx=1, pady=1)
-                    self.date_buttons.append(btn)
-
-                col += 1
-            row += 1
+        self.day_grid.show(self.current_year, self.current_month, self.day_style)
+
+    def day_style(self, day):
+        if (
+            day == self.today.day and
+            self.current_month == self.today.month and
+            self.current_year == self.today.year
+        ):
+            return {"bg": "lightblue"}
+        return None
 
     def select_date(self, day):
         self.selected_date = f"{self.current_year}-{self.current_month:02d}-{day:02d}"
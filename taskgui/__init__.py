@@ -0,0 +1 @@
+"""Shared building blocks for the calendar and task manager scripts."""
@@ -0,0 +1,83 @@
+"""Start one of the front ends: ``python -m taskgui <app> [options]``.
+
+The scripts stay runnable on their own; this only picks one and runs it
+as ``__main__`` from the repository root, so nothing for the other front
+ends is imported. Data files are still read from the current directory.
+Options after the app name are passed on (e.g. ``--profile``).
+
+``--first-frame`` prints how long it took, from the launcher starting to
+the first window being drawn, then closes it; ``benchmarks/startup.py``
+uses it to track startup time.
+"""
+
+import os
+import runpy
+import sys
+import time
+
+# These modules are already loaded by ``python -m``, so this is the start
+STARTED = time.perf_counter()
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> (script, description)
+APPS = {
+    "calendar": ("guiscrolbartime.py", "calendar with alarms and reminders"),
+    "events": ("import tkinter as max.py", "calendar with one note per day"),
+    "login": ("setting integrate merge.py", "multi-user calendar behind a login"),
+    "planner": ("input json parse", "Linux Pro Planner (tasks by date)"),
+    "taskease": ("version2 for button", "TaskEase task manager"),
+    "tasks": ("functionality", "task calendar with month shards"),
+    "todo": ("taskcontent", "Task Ease list"),
+    "viewer": ("task on date.py", "plain month calendar"),
+}
+
+FIRST_FRAME = "--first-frame"
+
+
+def usage():
+    lines = ["usage: python -m taskgui <app> [--first-frame] [app options]", "", "apps:"]
+    lines += [f"  {name:<10} {description}" for name, (_, description) in APPS.items()]
+    return "\n".join(lines)
+
+
+def report_first_frame():
+    """Make the first mainloop() print the time to its first frame and return."""
+    import tkinter
+
+    mainloop = tkinter.Misc.mainloop
+
+    def first_frame(widget, n=0):
+        def drawn():
+            widget.update_idletasks()
+            ms = (time.perf_counter() - STARTED) * 1000
+            print(f"first frame: {ms:.1f} ms", file=sys.stderr)
+            widget._root().destroy()
+        # Tk draws from idle callbacks queued when the widgets were made,
+        # so this one runs after them
+        widget.after_idle(drawn)
+        tkinter.Misc.mainloop = mainloop
+        mainloop(widget, n)
+
+    tkinter.Misc.mainloop = first_frame
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in APPS:
+        print(usage(), file=sys.stderr)
+        return 2
+
+    script = os.path.join(ROOT, APPS[argv[0]][0])
+    options = argv[1:]
+    if FIRST_FRAME in options:
+        options.remove(FIRST_FRAME)
+        report_first_frame()
+
+    sys.argv = [script] + options
+    runpy.run_path(script, run_name="__main__")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Tk-free logic shared by the calendar and task manager GUIs.
+
+Names are imported from their submodules on first use, so importing
+one submodule (or the package) does not load all the others.
+"""
+
+import importlib
+
+# name -> submodule defining it
+_EXPORTS = {
+    "Category": "records",
+    "DateIndex": "dates",
+    "DateKey": "dates",
+    "DaySummary": "index",
+    "DaySummaryIndex": "index",
+    "Event": "records",
+    "EventBook": "events",
+    "ExportItem": "exporters",
+    "ImportProgress": "importers",
+    "Inotify": "sync",
+    "JournalStore": "storage",
+    "JsonFileStore": "storage",
+    "JsonTaskStore": "taskstore",
+    "LatencyHistogram": "profiling",
+    "MonthShards": "shards",
+    "OccurrenceCache": "recurrence",
+    "PersistenceWorker": "persist",
+    "PlannerTask": "records",
+    "Priority": "records",
+    "Profiler": "profiling",
+    "RecurringTasks": "taskstore",
+    "ReminderScheduler": "scheduler",
+    "Rule": "recurrence",
+    "SaveCoalescer": "persist",
+    "SearchIndex": "search",
+    "ShardedTaskStore": "taskstore",
+    "SqliteTaskStore": "taskstore",
+    "Status": "records",
+    "SyncedRecords": "sync",
+    "TitleIndex": "index",
+    "TodoItem": "records",
+    "TodoList": "todo",
+    "atomic_write_json": "storage",
+    "atomic_write_text": "storage",
+    "event_items": "exporters",
+    "export_chunks": "exporters",
+    "file_signature": "sync",
+    "import_tasks": "importers",
+    "import_todos": "importers",
+    "is_ics": "exporters",
+    "locked": "sync",
+    "month_of": "shards",
+    "normalize_key": "dates",
+    "open_task_store": "taskstore",
+    "parse_event_key": "scheduler",
+    "partition_path": "storage",
+    "planner_items": "exporters",
+    "to_json": "records",
+    "tokenize": "search",
+    "write_export": "exporters",
+}
+
+__all__ = [
+    "Category",
+    "DateIndex",
+    "DateKey",
+    "DaySummary",
+    "DaySummaryIndex",
+    "Event",
+    "EventBook",
+    "ExportItem",
+    "ImportProgress",
+    "Inotify",
+    "JournalStore",
+    "JsonFileStore",
+    "JsonTaskStore",
+    "LatencyHistogram",
+    "MonthShards",
+    "OccurrenceCache",
+    "PersistenceWorker",
+    "PlannerTask",
+    "Priority",
+    "Profiler",
+    "RecurringTasks",
+    "ReminderScheduler",
+    "Rule",
+    "SaveCoalescer",
+    "SearchIndex",
+    "ShardedTaskStore",
+    "SqliteTaskStore",
+    "Status",
+    "SyncedRecords",
+    "TitleIndex",
+    "TodoItem",
+    "TodoList",
+    "atomic_write_json",
+    "atomic_write_text",
+    "event_items",
+    "export_chunks",
+    "file_signature",
+    "import_tasks",
+    "import_todos",
+    "is_ics",
+    "locked",
+    "month_of",
+    "normalize_key",
+    "open_task_store",
+    "parse_event_key",
+    "partition_path",
+    "planner_items",
+    "to_json",
+    "tokenize",
+    "write_export",
+]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,161 @@
+"""Normalized date keys and a sorted index for date range queries.
+
+The apps grew two key spellings: day keys like ``"2026-1-5"`` (planner,
+task calendar) and event keys like ``"2026-01-05 9:05 AM"`` (alarm
+calendar). ``DateKey`` parses either, plus its own canonical forms
+``"2026-01-05"`` and ``"2026-01-05 09:05"``, which sort as plain strings.
+``DateIndex`` keeps items ordered by ``DateKey`` so a range or the next
+``n`` items cost a bisect plus the items returned.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from datetime import date, datetime, time
+from functools import lru_cache
+
+
+class DateKey(namedtuple("DateKey", "when all_day")):
+    """A point in time; ``all_day`` keys sort after timed keys at midnight."""
+
+    __slots__ = ()
+
+    @classmethod
+    def parse(cls, text):
+        """Parse any known key spelling; raises ValueError if it is none of them."""
+        return _parse(text)
+
+    @classmethod
+    def coerce(cls, value):
+        """Make a range bound from a DateKey, datetime, date or key string.
+
+        A ``date`` becomes the start of that day, so it sorts before every
+        key on the day.
+        """
+        if isinstance(value, DateKey):
+            return value
+        if isinstance(value, datetime):
+            return cls(value, False)
+        if isinstance(value, date):
+            return cls(datetime.combine(value, time.min), False)
+        return cls.parse(value)
+
+    @property
+    def date(self):
+        return self.when.date()
+
+    def isoformat(self):
+        """The canonical key: ``"2026-01-05"`` or ``"2026-01-05 09:05"``."""
+        if self.all_day:
+            return self.when.strftime("%Y-%m-%d")
+        return self.when.strftime("%Y-%m-%d %H:%M")
+
+    def day_key(self):
+        """The legacy unpadded day key, e.g. ``"2026-1-5"``."""
+        return f"{self.when.year}-{self.when.month}-{self.when.day}"
+
+
+@lru_cache(maxsize=4096)
+def _parse(text):
+    day, _, clock = text.strip().replace("T", " ", 1).partition(" ")
+    year, month, mday = day.split("-")
+    when = datetime(int(year), int(month), int(mday))
+    if not clock:
+        return DateKey(when, True)
+
+    clock, _, meridiem = clock.strip().partition(" ")
+    hours, minutes = clock.split(":")[:2]
+    hours, minutes = int(hours), int(minutes)
+    meridiem = meridiem.strip().upper()
+    if meridiem:
+        if meridiem not in ("AM", "PM") or not 1 <= hours <= 12:
+            raise ValueError(f"bad 12-hour time in key {text!r}")
+        hours = hours % 12 + (12 if meridiem == "PM" else 0)
+    return DateKey(when.replace(hour=hours, minute=minutes), False)
+
+
+@lru_cache(maxsize=4096)
+def normalize_key(text):
+    """The canonical spelling of any day or event key."""
+    return _parse(text).isoformat()
+
+
+@lru_cache(maxsize=4096)
+def parse_date_key(date_key):
+    """Parse a day key like ``"2026-1-5"`` (padded or not) to a ``date``."""
+    return _parse(date_key).when.date()
+
+
+def normalize_keys(mapping):
+    """Respell the keys of a dict in canonical form, in place.
+
+    Lists filed under two spellings of one key are merged; for other values
+    the later key wins. Returns True if anything changed, so the caller
+    knows to save the migrated data.
+    """
+    stale = [key for key in mapping if normalize_key(key) != key]
+    for key in stale:
+        value = mapping.pop(key)
+        canonical = normalize_key(key)
+        current = mapping.get(canonical)
+        if isinstance(current, list) and isinstance(value, list):
+            current.extend(value)
+        else:
+            mapping[canonical] = value
+    return bool(stale)
+
+
+class DateIndex:
+    """Items kept sorted by ``DateKey``, for range and "next n" queries.
+
+    Items that share a key stay in insertion order. ``add`` and ``remove``
+    are O(log n) to find the slot plus the list shift, which is a memmove
+    even for hundreds of thousands of items.
+    """
+
+    def __init__(self):
+        self._keys = []   # sorted DateKeys
+        self._items = []  # item for the DateKey at the same position
+
+    def __len__(self):
+        return len(self._keys)
+
+    def clear(self):
+        self._keys = []
+        self._items = []
+
+    def rebuild(self, pairs):
+        """Replace the contents with ``(key, item)`` pairs; keys may be strings."""
+        pairs = sorted((DateKey.coerce(key), n, item) for n, (key, item) in enumerate(pairs))
+        self._keys = [key for key, _, _ in pairs]
+        self._items = [item for _, _, item in pairs]
+
+    def add(self, key, item):
+        key = DateKey.coerce(key)
+        i = bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._items.insert(i, item)
+
+    def remove(self, key, item):
+        key = DateKey.coerce(key)
+        i = bisect_left(self._keys, key)
+        end = bisect_right(self._keys, key, i)
+        for j in range(i, end):
+            if self._items[j] == item:
+                del self._keys[j]
+                del self._items[j]
+                return True
+        return False
+
+    def range(self, start, end):
+        """Yield ``(key, item)`` for keys in ``[start, end)``."""
+        lo = bisect_left(self._keys, DateKey.coerce(start))
+        hi = bisect_left(self._keys, DateKey.coerce(end), lo)
+        return zip(self._keys[lo:hi], self._items[lo:hi])
+
+    def upcoming(self, n, now=None):
+        """The first ``n`` ``(key, item)`` pairs at or after ``now``.
+
+        Pass a ``date`` to include every key on that day.
+        """
+        lo = bisect_left(self._keys, DateKey.coerce(now or datetime.now()))
+        return list(zip(self._keys[lo:lo + n], self._items[lo:lo + n]))
@@ -0,0 +1,175 @@
+"""The alarm calendar's events, without any widgets.
+
+``EventBook`` owns the journal-backed event dict and the three indexes
+kept over it: one-off events in time order (``DateIndex``), recurring
+events (``OccurrenceCache``) and pending alarms (``ReminderScheduler``).
+Keys are the canonical ``"YYYY-MM-DD HH:MM"`` spelling; any older spelling
+passed in is normalized first.
+"""
+
+from datetime import date, datetime
+
+from taskgui.core.dates import DateIndex, normalize_key
+from taskgui.core.records import Event, to_json
+from taskgui.core.recurrence import OccurrenceCache
+from taskgui.core.scheduler import ReminderScheduler, parse_event_key
+from taskgui.core.storage import JournalStore
+
+# Catch-up reminders listed in one message before the rest are summarized
+MAX_REMINDERS_SHOWN = 10
+
+
+class EventBook:
+
+    def __init__(self, path):
+        self.store = JournalStore(
+            path,
+            decode=lambda key, data: Event.from_dict(data, key),
+            default=to_json,
+            on_merge=self._merged
+        )
+        self.events = {}
+        self.dates = DateIndex()
+        self.series = OccurrenceCache()
+        self.reminders = ReminderScheduler()
+
+    def __contains__(self, key):
+        return key in self.events
+
+    def __getitem__(self, key):
+        return self.events[key]
+
+    def load(self, now=None):
+        self.events = self.store.load()
+
+        # Older files used "2026-01-05 9:05 AM" keys; respell them once
+        for key, event in list(self.events.items()):
+            if event.when is not None and normalize_key(key) != key:
+                self.store.delete(key)
+                self.store.put(normalize_key(key), event)
+
+        self.dates.rebuild(
+            (event.when, key) for key, event in self.events.items()
+            if event.when is not None and event.rule is None
+        )
+        for key, event in self.events.items():
+            if event.rule is not None and event.when is not None:
+                self.series.set(key, event.when, event.rule)
+        self.reminders.load(self.events, now)
+        return self.events
+
+    def save(self, key, text, color, rule=None, now=None):
+        """Add or replace the event at ``key``; returns the canonical key."""
+        key = normalize_key(key)
+        event = Event(text, color, when=parse_event_key(key), rule=rule)
+        if rule is not None and event.when is not None:
+            # Occurrences already past when the series is saved do not ring
+            event.fired = rule.last_until(event.when, now or datetime.now())
+        if key in self.events:
+            self._unindex(key, self.events[key])
+        self.store.put(key, event)
+        self._index(key, event)
+        self._reschedule(key, now)
+        return key
+
+    def delete(self, key, now=None):
+        """Delete the event at ``key``, or skip a series' occurrence there.
+
+        Returns ``"deleted"``, ``"skipped"`` or None if nothing was at ``key``.
+        """
+        when = parse_event_key(key)
+        if when is None:
+            return None
+        key = normalize_key(key)
+        if key in self.events:
+            self._unindex(key, self.events[key])
+            self.store.delete(key)
+            self.reminders.remove(key)
+            return "deleted"
+
+        for series_key in self.series.on_day(when.date()):
+            event = self.events[series_key]
+            if event.when.time() == when.time():
+                event.rule.exceptions.add(when.date())
+                self.store.put(series_key, event)
+                self.series.invalidate()
+                self._reschedule(series_key, now)
+                return "skipped"
+        return None
+
+    def fire_due(self, now=None):
+        """Pop the alarms due by ``now`` and advance or retire their events."""
+        now = now or datetime.now()
+        due_keys = self.reminders.pop_due(now)
+        for key in due_keys:
+            event = self.events[key]
+            if event.rule is not None:
+                # A series remembers what rang and moves on to its next occurrence
+                event.fired = event.rule.last_until(event.when, now)
+                due = event.next_due(now)
+                if due is not None:
+                    self.reminders.add(key, due)
+                else:
+                    event.alerted = True
+            else:
+                event.alerted = True
+            self.store.put(key, event)
+        return due_keys
+
+    def next_due(self):
+        return self.reminders.next_due()
+
+    def month_colors(self, year, month):
+        """Map each day of the month with events to its first event's colour."""
+        start = date(year, month, 1)
+        end = date(year + month // 12, month % 12 + 1, 1)
+        colors = {}
+        for date_key, key in self.dates.range(start, end):
+            colors.setdefault(date_key.when.day, self.events[key].color)
+        for day, keys in self.series.month(year, month).items():
+            colors.setdefault(day, self.events[keys[0]].color)
+        return colors
+
+    def format_reminders(self, keys, limit=MAX_REMINDERS_SHOWN):
+        if len(keys) == 1:
+            return self.events[keys[0]].text
+
+        lines = [f"{key}: {self.events[key].text}" for key in keys[:limit]]
+        if len(keys) > limit:
+            lines.append(f"... and {len(keys) - limit} more")
+        return "\n".join(lines)
+
+    def close(self):
+        # Folds the change log into the snapshot
+        self.store.close()
+
+    # ---- internals ----
+
+    def _index(self, key, event):
+        if event.rule is None:
+            self.dates.add(key, key)
+        else:
+            self.series.set(key, event.when, event.rule)
+
+    def _unindex(self, key, event):
+        if event.rule is None:
+            self.dates.remove(key, key)
+        else:
+            self.series.discard(key)
+
+    def _merged(self, changes):
+        # Events another app saved to the file, picked up by a compaction
+        for key, (old, new) in changes.items():
+            if old is not None and old.when is not None:
+                self._unindex(key, old)
+                self.reminders.remove(key)
+            if new is not None and new.when is not None:
+                self._index(key, new)
+                self._reschedule(key)
+
+    def _reschedule(self, key, now=None):
+        due = self.events[key].next_due(now or datetime.now())
+        if due is None:
+            self.reminders.remove(key)
+        else:
+            self.reminders.add(key, due)
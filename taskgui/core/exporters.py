@@ -0,0 +1,388 @@
+"""Streaming iCalendar (.ics) and CSV export of calendar events and planner tasks.
+
+Records flow through generators from the source to the file:
+``event_items``/``task_items`` yield ``ExportItem`` records in date
+order, ``ics_chunks``/``csv_chunks`` turn them into text chunks of about
+``CHUNK_CHARS`` characters, and ``write_export`` writes each chunk as it
+comes, so the whole output is never held in memory.
+
+``start`` and ``end`` (inclusive; a date, datetime or key string) limit
+the export to a date range. Planner shard directories and SQLite files
+are only read for that range: the shards of months outside it are never
+opened, and SQLite answers from its date index.
+
+Exports read back in with ``taskgui.core.importers``. Events export as
+VEVENT and tasks as VTODO. A repeating event is one VEVENT with an RRULE
+(and EXDATEs for skipped days) in a whole-calendar .ics export; for CSV,
+or when a date range is given, its occurrences in the range are written
+one by one, up to ``OPEN_END_DAYS`` past today for a series without an
+end.
+
+    python -m taskgui.core.exporters (--events FILE | --tasks PATH) OUTPUT
+                                     [--from 2026-01-01] [--to 2026-01-31]
+"""
+
+import csv
+import io
+import json
+import os
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+from taskgui.core.dates import DateKey
+from taskgui.core.recurrence import Rule
+from taskgui.core.storage import file_mode, read_journal
+
+CHUNK_CHARS = 64 * 1024
+CSV_HEADER = ("date", "time", "task", "category", "priority", "status")
+# RFC 5545 priorities, the reverse of the importer's mapping
+ICS_PRIORITIES = {"High": "1", "Normal": "5", "Low": "9"}
+FOLD_OCTETS = 75
+# How far past today a series with no end is expanded
+OPEN_END_DAYS = 366
+ICS_WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+
+class ExportItem(namedtuple("ExportItem", "uid kind when all_day text category priority status rule",
+                            defaults=(None,))):
+    """One exported record; ``kind`` is ``"VEVENT"`` or ``"VTODO"``.
+
+    ``rule`` is the ``Rule`` of a repeating event written as one series.
+    """
+
+    __slots__ = ()
+
+
+# ---- sources ----
+
+def event_items(events, start=None, end=None, expand=False):
+    """Yield the events in ``events`` (key -> Event or dict) within the range, by date.
+
+    A repeating event is one item carrying its rule, unless ``expand`` is
+    set or a range is given: then each occurrence in the range is an item.
+    """
+    low, high = _bounds(start, end)
+    expand = expand or low is not None or high is not None
+    found = []
+    for key in events:
+        try:
+            when = DateKey.parse(key)
+        except ValueError:
+            continue  # not a date key; nothing to place it on
+        rule = _rule_of(events[key])
+        if rule is not None and expand:
+            for occurrence in _occurrences(rule, when.when, low, high):
+                found.append((DateKey(occurrence, when.all_day), key, None))
+        elif _within(when, low, high):
+            found.append((when, key, rule))
+    found.sort(key=lambda item: item[:2])
+
+    for when, key, rule in found:
+        event = events[key]
+        text = event.text if hasattr(event, "text") else event.get("text", "")
+        uid = when.isoformat().replace(" ", "T")
+        if when.isoformat() != key:
+            uid += "-" + key.replace(" ", "T")  # an occurrence of the series at ``key``
+        yield ExportItem(uid + "@taskgui", "VEVENT", when.when, when.all_day, text, "", "", "", rule)
+
+
+def task_items(tasks, start=None, end=None):
+    """Yield planner tasks from a ``{date_key: [task dict]}`` mapping within the range."""
+    low, high = _bounds(start, end)
+    days = []
+    for date_key in tasks:
+        try:
+            day = DateKey.parse(date_key)
+        except ValueError:
+            continue
+        if _within(day, low, high):
+            days.append((day, date_key))
+    days.sort()
+
+    for day, date_key in days:
+        for number, task in enumerate(tasks[date_key]):
+            yield _task_item(day, task, f"{day.isoformat()}-{number}")
+
+
+def planner_items(path, start=None, end=None):
+    """Yield the tasks stored at ``path``: a month shard directory, SQLite file or JSON file."""
+    if os.path.isdir(path):
+        return _shard_items(path, start, end)
+    if path.lower().endswith((".db", ".sqlite", ".sqlite3")):
+        return _sqlite_items(path, start, end)
+    return task_items(_read_json(path), start, end)
+
+
+def journal_events(path):
+    """The alarm calendar's ``events.json`` with its change log applied.
+
+    Read-only: the files may belong to a running app.
+    """
+    return read_journal(path)
+
+
+# ---- formats ----
+
+def ics_chunks(items, stamp=None):
+    """Yield an iCalendar file for ``items`` in chunks of about ``CHUNK_CHARS``."""
+    stamp = (stamp or datetime.now(timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//taskgui//export//EN"]
+    size = 0
+    for item in items:
+        first = len(lines)
+        lines.append(f"BEGIN:{item.kind}")
+        lines.append(_fold("UID:" + _escape(item.uid)))
+        lines.append("DTSTAMP:" + stamp)
+        if item.all_day:
+            lines.append(item.when.strftime("DTSTART;VALUE=DATE:%Y%m%d"))
+        else:
+            # Floating local time, as the apps keep it
+            lines.append(item.when.strftime("DTSTART:%Y%m%dT%H%M%S"))
+        if item.rule is not None:
+            lines += _rrule(item.rule, item.when, item.all_day)
+        summary, _, _ = item.text.partition("\n")
+        lines.append(_fold("SUMMARY:" + _escape(summary)))
+        if summary != item.text:
+            lines.append(_fold("DESCRIPTION:" + _escape(item.text)))
+        if item.category:
+            lines.append(_fold("CATEGORIES:" + _escape(item.category)))
+        if item.priority in ICS_PRIORITIES:
+            lines.append("PRIORITY:" + ICS_PRIORITIES[item.priority])
+        if item.kind == "VTODO":
+            lines.append("STATUS:" + ("COMPLETED" if item.status == "Done" else "NEEDS-ACTION"))
+        lines.append(f"END:{item.kind}")
+
+        size += sum(len(line) for line in lines[first:])
+        if size >= CHUNK_CHARS:
+            yield "\r\n".join(lines) + "\r\n"
+            lines, size = [], 0
+    lines.append("END:VCALENDAR")
+    yield "\r\n".join(lines) + "\r\n"
+
+
+def csv_chunks(items):
+    """Yield a CSV file for ``items``, with a header row the importer understands."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    for item in items:
+        writer.writerow((
+            item.when.strftime("%Y-%m-%d"),
+            "" if item.all_day else item.when.strftime("%H:%M"),
+            item.text,
+            item.category,
+            item.priority,
+            item.status,
+        ))
+        if buffer.tell() >= CHUNK_CHARS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def is_ics(path):
+    """Whether ``path`` names an iCalendar export; anything else is CSV."""
+    return path.lower().endswith(".ics")
+
+
+def export_chunks(items, path):
+    """Chunks in the format named by ``path``'s extension (``.ics``, otherwise CSV)."""
+    if is_ics(path):
+        return ics_chunks(items)
+    return csv_chunks(items)
+
+
+def write_export(path, chunks):
+    """Write ``chunks`` to ``path`` as they are produced; returns the characters written.
+
+    The file goes to a temp file first and is renamed over ``path`` only
+    once complete, so a failed export never leaves half a file behind.
+    """
+    import tempfile
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".export-", dir=directory)
+    written = 0
+    try:
+        # CSV rows carry their own line endings
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                written += len(chunk)
+        os.chmod(tmp, file_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return written
+
+
+# ---- internals ----
+
+def _bounds(start, end):
+    low = DateKey.coerce(start).date if start is not None else None
+    high = DateKey.coerce(end).date if end is not None else None
+    return low, high
+
+
+def _within(key, low, high):
+    day = key.date
+    return (low is None or day >= low) and (high is None or day <= high)
+
+
+def _rule_of(event):
+    if hasattr(event, "rule"):
+        return event.rule
+    repeat = event.get("repeat") if isinstance(event, dict) else None
+    return Rule.from_dict(repeat) if repeat else None
+
+
+def _occurrences(rule, first, low, high):
+    midnight = datetime.min.time()
+    lo = datetime.combine(low, midnight) if low is not None else first
+    if high is not None:
+        hi = datetime.combine(high, midnight) + timedelta(days=1)
+    elif rule.count is None and rule.until is None:
+        hi = max(lo, datetime.combine(datetime.now().date(), midnight)) + timedelta(days=OPEN_END_DAYS)
+    else:
+        hi = datetime.max  # the series ends by itself
+    return rule.between(first, lo, hi)
+
+
+def _rrule(rule, when, all_day):
+    """RRULE and EXDATE lines for a series first occurring at ``when``."""
+    parts = [f"FREQ={rule.freq.upper()}"]
+    if rule.interval != 1:
+        parts.append(f"INTERVAL={rule.interval}")
+    if rule.weekdays:
+        parts.append("BYDAY=" + ",".join(ICS_WEEKDAYS[d] for d in rule.weekdays))
+    if rule.count is not None:
+        parts.append(f"COUNT={rule.count}")
+    if rule.until is not None:
+        # Takes DTSTART's value type; the whole last day is allowed
+        parts.append("UNTIL=" + rule.until.strftime("%Y%m%d" if all_day else "%Y%m%dT235959"))
+    lines = ["RRULE:" + ";".join(parts)]
+    for day in sorted(rule.exceptions):
+        skipped = datetime.combine(day, when.time())
+        if all_day:
+            lines.append(skipped.strftime("EXDATE;VALUE=DATE:%Y%m%d"))
+        else:
+            lines.append(skipped.strftime("EXDATE:%Y%m%dT%H%M%S"))
+    return lines
+
+
+def _task_item(day, task, uid):
+    clock = task.get("time") or "00:00"
+    try:
+        when = DateKey.parse(f"{day.isoformat()} {clock}")
+    except ValueError:
+        when = DateKey(day.when, False)
+    return ExportItem(
+        f"{task.get('id') or uid}@taskgui",
+        "VTODO",
+        when.when,
+        False,
+        task.get("task", ""),
+        task.get("category", ""),
+        task.get("priority", ""),
+        task.get("status", ""),
+    )
+
+
+def _read_json(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _shard_items(directory, start, end):
+    low, high = _bounds(start, end)
+    months = []
+    for name in os.listdir(directory):
+        stem, ext = os.path.splitext(name)
+        year, _, month = stem.partition("-")
+        if ext != ".json" or not (year.isdigit() and month.isdigit()):
+            continue
+        key = (int(year), int(month))
+        if (low is None or key >= (low.year, low.month)) and \
+                (high is None or key <= (high.year, high.month)):
+            months.append((key, name))
+
+    # One month file in memory at a time
+    for _, name in sorted(months):
+        yield from task_items(_read_json(os.path.join(directory, name)), start, end)
+
+
+def _sqlite_items(path, start, end):
+    import sqlite3
+    low, high = _bounds(start, end)
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(
+            "SELECT CAST(id AS TEXT), date, time, task, category, priority, status FROM tasks"
+            " WHERE date BETWEEN ? AND ? ORDER BY date, time, id",
+            (low.isoformat() if low else "0000", high.isoformat() if high else "9999-12-31"),
+        )
+        for task_id, date, time, text, category, priority, status in rows:
+            task = {"id": task_id, "time": time, "task": text, "category": category,
+                    "priority": priority, "status": status}
+            yield _task_item(DateKey.parse(date), task, task_id)
+    finally:
+        conn.close()
+
+
+def _escape(text):
+    return (text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def _fold(line):
+    # Lines longer than 75 octets continue on lines starting with a space,
+    # split between characters, never inside a UTF-8 sequence
+    if len(line) <= FOLD_OCTETS // 4 or len(line.encode("utf-8")) <= FOLD_OCTETS:
+        return line
+    parts, current, size = [], [], 0
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > FOLD_OCTETS:
+            parts.append("".join(current))
+            current, size = [], 1  # the leading space
+        current.append(char)
+        size += width
+    parts.append("".join(current))
+    return "\r\n ".join(parts)
+
+
+# ---- command line ----
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--events", help="alarm or event calendar JSON file")
+    source.add_argument("--tasks", help="planner JSON file, shard directory or SQLite file")
+    parser.add_argument("output", help="file to write; .ics for iCalendar, otherwise CSV")
+    parser.add_argument("--from", dest="start", help="first day to export (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", help="last day to export (YYYY-MM-DD)")
+    args = parser.parse_args(argv)
+
+    count = [0]
+
+    def counted(items):
+        for item in items:
+            count[0] += 1
+            yield item
+
+    if args.events:
+        items = event_items(journal_events(args.events), args.start, args.end,
+                            expand=not is_ics(args.output))
+    else:
+        items = planner_items(args.tasks, args.start, args.end)
+    write_export(args.output, export_chunks(counted(items), args.output))
+    print(f"{count[0]} exported to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
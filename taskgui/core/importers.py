@@ -0,0 +1,286 @@
+"""Streaming CSV and iCalendar (.ics) import for planner tasks and TaskEase.
+
+Files are read a line at a time and parsed by generators, so memory stays
+bounded by ``batch_size`` whatever the file size. Rows are validated and
+normalized as they stream past; each full batch goes to the store's
+``add_many``, which writes it in one go and returns how many records it
+took. ``import_tasks`` and ``import_todos`` are generators too: they yield
+an ``ImportProgress`` after every batch, so a GUI can run one batch per
+``after()`` tick and keep a progress bar moving.
+
+CSV files need a header row; columns are matched by name, ignoring case,
+with a few common aliases (``title``/``summary`` for the task text, and
+so on). From .ics files, VEVENT and VTODO components are read.
+"""
+
+import csv
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from taskgui.core.dates import DateKey
+from taskgui.core.records import TodoItem
+
+BATCH_SIZE = 5000
+# Invalid rows reported back individually; the rest are only counted
+MAX_ERRORS = 20
+
+TASK_COLUMNS = {
+    "date": ("date", "day", "due", "start", "dtstart"),
+    "time": ("time", "start time"),
+    "task": ("task", "title", "summary", "subject", "description"),
+    "category": ("category", "categories"),
+    "priority": ("priority",),
+    "status": ("status",),
+}
+TODO_COLUMNS = {
+    "title": ("title", "task", "summary", "subject"),
+    "note": ("note", "notes", "description"),
+    "done": ("done", "status", "completed"),
+}
+TRUE_WORDS = {"1", "true", "yes", "y", "x", "done", "completed"}
+PRIORITIES = {"high": "High", "normal": "Normal", "medium": "Normal", "low": "Low"}
+
+
+class ImportProgress:
+    """Running totals of an import; ``fraction`` is how much of the file was read."""
+
+    __slots__ = ("imported", "skipped", "fraction", "errors")
+
+    def __init__(self):
+        self.imported = 0
+        self.skipped = 0
+        self.fraction = 0.0
+        self.errors = []
+
+    def reject(self, where, reason):
+        self.skipped += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(f"{where}: {reason}")
+
+
+class LineSource:
+    """A file's decoded lines, counting the bytes read for progress."""
+
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path) or 1
+        self.position = 0
+
+    def lines(self):
+        with open(self.path, "rb") as f:
+            for raw in f:
+                self.position += len(raw)
+                yield raw.decode("utf-8-sig", errors="replace")
+
+    def fraction(self):
+        return min(self.position / self.size, 1.0)
+
+
+# ---- parsing ----
+
+def read_csv(lines, columns):
+    """Yield ``(row number, {field: value})`` with fields named as in ``columns``."""
+    reader = csv.reader(lines)
+    header = [name.strip().lower() for name in next(reader, [])]
+    positions = {}
+    for field, aliases in columns.items():
+        for alias in aliases:
+            if alias in header:
+                positions[field] = header.index(alias)
+                break
+    for row in reader:
+        if not any(row):
+            continue
+        yield reader.line_num, {
+            field: row[i].strip() for field, i in positions.items() if i < len(row)
+        }
+
+
+def read_ics(lines):
+    """Yield ``(line number, component)`` for each VEVENT and VTODO.
+
+    A component maps property names to ``(params, value)``, with text
+    values unescaped; ``"kind"`` holds ``"VEVENT"`` or ``"VTODO"``.
+    """
+    component = None
+    for number, line in _unfold(lines):
+        if line.startswith("BEGIN:"):
+            kind = line[6:].upper()
+            if kind in ("VEVENT", "VTODO"):
+                component = {"kind": kind}
+                start = number
+        elif line.startswith("END:"):
+            if component is not None and line[4:].upper() == component["kind"]:
+                yield start, component
+                component = None
+        elif component is not None:
+            name, _, value = line.partition(":")
+            name, _, params = name.partition(";")
+            component.setdefault(name.upper(), (params.upper(), _unescape(value)))
+
+
+def _unfold(lines):
+    # Long .ics lines continue on lines starting with a space or tab
+    pending, start = None, 0
+    for number, line in enumerate(lines, 1):
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending:
+            yield start, pending
+        pending, start = line, number
+    if pending:
+        yield start, pending
+
+
+def _unescape(value):
+    if "\\" not in value:
+        return value
+    out, chars = [], iter(value)
+    for char in chars:
+        if char == "\\":
+            char = next(chars, "")
+            char = "\n" if char in "nN" else char
+        out.append(char)
+    return "".join(out)
+
+
+# ---- validation ----
+
+def planner_row(fields):
+    """``(date_key, task dict)`` from CSV fields; raises ValueError if unusable."""
+    text = fields.get("task", "")
+    if not text:
+        raise ValueError("no task text")
+    day, clock = _day(fields.get("date", ""))
+    clock = fields.get("time") or clock
+    return day, {
+        "task": text,
+        "time": _clock(clock) if clock else "00:00",
+        "category": fields.get("category", "").split(",")[0].strip() or "General",
+        "priority": PRIORITIES.get(fields.get("priority", "").lower(), "Normal"),
+        "status": "Done" if fields.get("status", "").lower() in TRUE_WORDS else "Pending",
+    }
+
+
+def ics_row(component):
+    """``(date_key, task dict)`` from a VEVENT or VTODO."""
+    value = (component.get("DTSTART") or component.get("DUE") or ("", ""))[1]
+    when = _ics_datetime(value)
+    fields = {
+        "task": component.get("SUMMARY", ("", ""))[1].strip(),
+        "date": when.strftime("%Y-%m-%d"),
+        "time": when.strftime("%H:%M") if "T" in value else "",
+        "category": component.get("CATEGORIES", ("", ""))[1],
+        "priority": _ics_priority(component.get("PRIORITY", ("", ""))[1]),
+        "status": component.get("STATUS", ("", ""))[1],
+    }
+    return planner_row(fields)
+
+
+def todo_item(fields):
+    title = fields.get("title", "")
+    if not title:
+        raise ValueError("no title")
+    done = fields.get("done", "").lower() in TRUE_WORDS
+    return TodoItem(title, fields.get("note", ""), done)
+
+
+def ics_todo(component):
+    return todo_item({
+        "title": component.get("SUMMARY", ("", ""))[1].strip(),
+        "note": component.get("DESCRIPTION", ("", ""))[1],
+        "done": component.get("STATUS", ("", ""))[1],
+    })
+
+
+@lru_cache(maxsize=4096)
+def _day(text):
+    """``(day key, time or None)``; exports repeat dates, so this is cached."""
+    try:
+        key = DateKey.parse(text)
+    except ValueError:
+        raise ValueError(f"bad date {text!r}") from None
+    return key.when.strftime("%Y-%m-%d"), None if key.all_day else key.when.strftime("%H:%M")
+
+
+@lru_cache(maxsize=2048)
+def _clock(text):
+    # "9:05", "09:05:00" and "9:05 AM" all parse like the time in a key
+    try:
+        return DateKey.parse(f"2000-01-01 {text}").when.strftime("%H:%M")
+    except ValueError:
+        raise ValueError(f"bad time {text!r}") from None
+
+
+def _ics_datetime(value):
+    if not value:
+        raise ValueError("no DTSTART")
+    try:
+        if "T" not in value:
+            return datetime.strptime(value[:8], "%Y%m%d")
+        when = datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+    except ValueError:
+        raise ValueError(f"bad date {value!r}") from None
+    if value.endswith("Z"):
+        # UTC times are shown in local time; TZID times are kept as written
+        when = when.replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+    return when
+
+
+def _ics_priority(value):
+    # RFC 5545: 1-4 high, 5 medium, 6-9 low, 0 undefined
+    if not value.isdigit() or value == "0":
+        return ""
+    level = int(value)
+    return "high" if level < 5 else "normal" if level == 5 else "low"
+
+
+# ---- import ----
+
+def import_tasks(store, path, batch_size=BATCH_SIZE):
+    """Import a CSV or .ics file into a planner task store, batch by batch."""
+    if path.lower().endswith(".ics"):
+        return _import(path, read_ics, ics_row, store.add_many, batch_size)
+    return _import(path, lambda lines: read_csv(lines, TASK_COLUMNS), planner_row,
+                   store.add_many, batch_size)
+
+
+def import_todos(todo_list, path, batch_size=BATCH_SIZE):
+    """Import a CSV or .ics file into a ``TodoList``; duplicate titles are skipped."""
+    if path.lower().endswith(".ics"):
+        return _import(path, read_ics, ics_todo, todo_list.add_many, batch_size)
+    return _import(path, lambda lines: read_csv(lines, TODO_COLUMNS), todo_item,
+                   todo_list.add_many, batch_size)
+
+
+def _import(path, parse, convert, add_many, batch_size):
+    source = LineSource(path)
+    progress = ImportProgress()
+    batch = []
+    rows = 0
+    for where, record in parse(source.lines()):
+        try:
+            batch.append(convert(record))
+        except ValueError as e:
+            progress.reject(f"line {where}", e)
+        rows += 1
+        # Rejected rows count too, so a long run of them still yields
+        if rows >= batch_size:
+            _commit(progress, batch, add_many)
+            batch = []
+            rows = 0
+            progress.fraction = source.fraction()
+            yield progress
+    _commit(progress, batch, add_many)
+    progress.fraction = 1.0
+    yield progress
+
+
+def _commit(progress, batch, add_many):
+    # Stores may refuse some records (e.g. duplicate titles)
+    added = add_many(batch) if batch else 0
+    progress.imported += added
+    progress.skipped += len(batch) - added
@@ -0,0 +1,99 @@
+"""In-memory indexes kept alongside the task stores."""
+
+import unicodedata
+from collections import Counter, namedtuple
+
+DaySummary = namedtuple("DaySummary", "count pending_high done")
+
+EMPTY_SUMMARY = DaySummary(0, 0, 0)
+
+
+def _summary_delta(task):
+    done = task.status == "Done"
+    pending_high = task.priority == "High" and not done
+    return int(pending_high), int(done)
+
+
+class DaySummaryIndex:
+    """Per-day task counts, updated incrementally as tasks change.
+
+    Callers must ``remove`` a task before mutating it and ``add`` it back
+    afterwards, so the counts always match the stored tasks.
+    """
+
+    def __init__(self):
+        self._days = {}  # date_key -> [count, pending_high, done]
+
+    def rebuild(self, tasks):
+        self._days = {}
+        for date_key, day_tasks in tasks.items():
+            for task in day_tasks:
+                self.add(date_key, task)
+
+    def add(self, date_key, task):
+        counts = self._days.get(date_key)
+        if counts is None:
+            counts = self._days[date_key] = [0, 0, 0]
+        pending_high, done = _summary_delta(task)
+        counts[0] += 1
+        counts[1] += pending_high
+        counts[2] += done
+
+    def remove(self, date_key, task):
+        counts = self._days.get(date_key)
+        if counts is None:
+            return
+        pending_high, done = _summary_delta(task)
+        counts[0] -= 1
+        counts[1] -= pending_high
+        counts[2] -= done
+        if counts[0] <= 0:
+            del self._days[date_key]
+
+    def get(self, date_key):
+        counts = self._days.get(date_key)
+        return DaySummary(*counts) if counts else EMPTY_SUMMARY
+
+    def __contains__(self, date_key):
+        return date_key in self._days
+
+
+class TitleIndex:
+    """Multiset of normalized titles for O(1) duplicate checks.
+
+    Titles are normalized with Unicode ``unicode_form`` (None to skip),
+    then optionally case-folded and whitespace-collapsed. Counts rather than
+    a plain set keep the index right when legacy data already holds
+    duplicates and one of them is removed.
+    """
+
+    def __init__(self, casefold=True, collapse_whitespace=True, unicode_form="NFKC"):
+        self.casefold = casefold
+        self.collapse_whitespace = collapse_whitespace
+        self.unicode_form = unicode_form
+        self._counts = Counter()
+
+    def normalize(self, title):
+        if self.unicode_form:
+            title = unicodedata.normalize(self.unicode_form, title)
+        if self.casefold:
+            title = title.casefold()
+        if self.collapse_whitespace:
+            title = " ".join(title.split())
+        return title
+
+    def rebuild(self, titles):
+        self._counts = Counter(self.normalize(title) for title in titles)
+
+    def add(self, title):
+        self._counts[self.normalize(title)] += 1
+
+    def remove(self, title):
+        key = self.normalize(title)
+        if self._counts[key] > 1:
+            self._counts[key] -= 1
+        else:
+            self._counts.pop(key, None)
+
+    def __contains__(self, title):
+        return self.normalize(title) in self._counts
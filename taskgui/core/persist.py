@@ -0,0 +1,156 @@
+"""Background persistence: file writes off the GUI thread, bursts coalesced.
+
+``PersistenceWorker`` owns a writer thread. ``submit(path, text)`` queues
+the latest text for a file; if several submissions for the same path
+arrive before the thread gets to it, only the newest is written. Every
+write goes to a temp file that is then renamed over the target. ``text``
+may also be a callable returning the text, which is then called on the
+writer thread. ``call(path, job)`` runs any other save of ``path`` there
+instead, such as a locked read-merge-write, coalesced the same way.
+
+``SaveCoalescer`` sits on the GUI side. ``request(path, snapshot)`` only
+marks the file dirty; after ``delay_ms`` of quiet the snapshot callable is
+run once, on the GUI thread, and its result handed to the worker, so a
+burst of edits costs one serialization and one write. Snapshots of big
+data should only copy it (a shallow copy is cheap) and return a function
+that serializes the copy, so the slow part runs on the writer thread. It needs a
+``loop`` with Tk's ``after``/``after_cancel`` (any widget will do), and
+delivers write errors to ``report(message)`` on the GUI thread.
+"""
+
+import functools
+import queue
+import threading
+
+from taskgui.core.storage import atomic_write_text
+
+SAVE_DELAY_MS = 250
+POLL_MS = 100
+
+
+class PersistenceWorker:
+
+    def __init__(self, on_error=None):
+        self.on_error = on_error
+        self._cond = threading.Condition()
+        self._pending = {}   # path -> newest job not yet run
+        self._writing = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="persistence", daemon=True)
+        self._thread.start()
+
+    def submit(self, path, text):
+        self.call(path, functools.partial(_write, path, text))
+
+    def call(self, path, job):
+        """Run ``job()`` on the writer thread, replacing any job for ``path`` not yet run."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("PersistenceWorker is closed")
+            self._pending[path] = job
+            self._cond.notify_all()
+
+    def busy(self):
+        with self._cond:
+            return bool(self._pending) or self._writing
+
+    def flush(self, timeout=None):
+        """Block until every submitted save has run. Returns False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._writing, timeout
+            )
+
+    def close(self):
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                batch = self._pending
+                self._pending = {}
+                self._writing = True
+
+            for path, job in batch.items():
+                try:
+                    job()
+                except Exception as exc:
+                    if self.on_error is not None:
+                        self.on_error(path, exc)
+
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+
+def _write(path, text):
+    atomic_write_text(path, text() if callable(text) else text)
+
+
+class SaveCoalescer:
+
+    def __init__(self, loop, report=None, delay_ms=SAVE_DELAY_MS, worker=None):
+        self.loop = loop
+        self.report = report
+        self.delay_ms = delay_ms
+        self._errors = queue.SimpleQueue()
+        self.worker = worker or PersistenceWorker()
+        self.worker.on_error = lambda path, exc: self._errors.put((path, exc))
+        self._dirty = {}     # path -> snapshot callable
+        self._job = None
+        self._poll_job = None
+
+    def request(self, path, snapshot):
+        """Save ``snapshot()`` to ``path`` once the current burst of edits ends."""
+        self._dirty[path] = snapshot
+        if self._job is not None:
+            self.loop.after_cancel(self._job)
+        self._job = self.loop.after(self.delay_ms, self._commit)
+
+    def flush(self):
+        """Write everything requested so far and wait for it to reach disk."""
+        if self._job is not None:
+            self.loop.after_cancel(self._job)
+        self._commit()
+        self.worker.flush()
+        self._report_errors()
+
+    def close(self):
+        self.flush()
+        if self._poll_job is not None:
+            self.loop.after_cancel(self._poll_job)
+            self._poll_job = None
+        self.worker.close()
+
+    def _commit(self):
+        self._job = None
+        dirty, self._dirty = self._dirty, {}
+        for path, snapshot in dirty.items():
+            self.worker.submit(path, snapshot())
+        if dirty and self._poll_job is None:
+            self._poll_job = self.loop.after(POLL_MS, self._poll)
+
+    def _poll(self):
+        self._poll_job = None
+        # Check before draining: a write that fails after the check is
+        # still picked up by the next poll
+        busy = self.worker.busy()
+        self._report_errors()
+        if busy:
+            self._poll_job = self.loop.after(POLL_MS, self._poll)
+
+    def _report_errors(self):
+        while True:
+            try:
+                path, exc = self._errors.get_nowait()
+            except queue.Empty:
+                return
+            if self.report is not None:
+                self.report(f"Could not save {path}: {exc}")
@@ -0,0 +1,156 @@
+"""Opt-in latency recording for GUI event handlers.
+
+``Profiler`` keeps a ``LatencyHistogram`` per handler name and one for
+main-loop stalls, and optionally a Chrome trace (load the JSON in
+chrome://tracing or Perfetto) and a cProfile run. It does not know about
+Tk: ``taskgui.widgets.instrument`` feeds it from Tk's callback wrapper.
+
+Profiling is switched on with ``--profile[=PATH]`` on the command line or
+``TASKGUI_PROFILE=PATH`` in the environment. A summary is printed to
+stderr on exit; a PATH ending in ``.prof``/``.pstats`` also dumps pstats,
+one ending in ``.json`` a Chrome trace.
+"""
+
+import cProfile
+import json
+import os
+import sys
+import time
+
+ENV_VAR = "TASKGUI_PROFILE"
+FLAG = "--profile"
+
+# Upper bucket bounds in ms; the last bucket takes everything slower
+BUCKETS_MS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+# Trace events kept before new ones are dropped, so long sessions stay bounded
+MAX_TRACE_EVENTS = 200_000
+
+STALL = "main loop stall"
+
+
+class LatencyHistogram:
+    """Counts of durations in power-of-two millisecond buckets."""
+
+    __slots__ = ("counts", "calls", "total", "worst")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.calls = 0
+        self.total = 0.0
+        self.worst = 0.0
+
+    def add(self, ms):
+        self.calls += 1
+        self.total += ms
+        self.worst = max(self.worst, ms)
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms <= bound:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def mean(self):
+        return self.total / self.calls if self.calls else 0.0
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding that fraction of calls."""
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= fraction * self.calls:
+                return BUCKETS_MS[i] if i < len(BUCKETS_MS) else self.worst
+        return 0.0
+
+
+class Profiler:
+
+    def __init__(self, path=None):
+        self.path = path
+        self.histograms = {}
+        self.trace = [] if path and path.endswith(".json") else None
+        self.dropped = 0
+        self._cprofile = None
+        if path and path.endswith((".prof", ".pstats")):
+            self._cprofile = cProfile.Profile()
+        self._origin = time.perf_counter()
+
+    def start(self):
+        self._origin = time.perf_counter()
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    def stop(self, out=None):
+        """Stop recording, write the output file if any and print the summary."""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.path)
+        elif self.trace is not None:
+            self.write_trace(self.path)
+        print(self.summary(), file=out or sys.stderr)
+
+    def record(self, name, start, end, kind="handler"):
+        """Add one call of ``name`` that ran from ``start`` to ``end`` (perf_counter)."""
+        ms = (end - start) * 1000
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        histogram.add(ms)
+
+        if self.trace is None:
+            return
+        if len(self.trace) >= MAX_TRACE_EVENTS:
+            self.dropped += 1
+            return
+        self.trace.append({
+            "name": name,
+            "cat": kind,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1e6),
+            "dur": round(ms * 1000),
+            "pid": os.getpid(),
+            "tid": 0,
+        })
+
+    def stall(self, start, end):
+        """The main loop could not run between ``start`` and ``end``."""
+        self.record(STALL, start, end, kind="stall")
+
+    def write_trace(self, path):
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.trace or [], "displayTimeUnit": "ms"}, f)
+
+    def summary(self):
+        labels = [f"<={b}" for b in BUCKETS_MS] + [">"]
+        lines = [
+            f"{'handler (ms)':<48} {'calls':>7} {'mean':>8} {'p95':>6} {'max':>8}  {' '.join(labels)}"
+        ]
+        ranked = sorted(self.histograms.items(), key=lambda item: -item[1].total)
+        for name, h in ranked:
+            counts = " ".join(f"{c:>{len(label)}}" for c, label in zip(h.counts, labels))
+            lines.append(
+                f"{name[:48]:<48} {h.calls:>7} {h.mean():>8.2f} {h.percentile(0.95):>6.0f} "
+                f"{h.worst:>8.2f}  {counts}"
+            )
+        if self.dropped:
+            lines.append(f"({self.dropped} trace events dropped)")
+        return "\n".join(lines)
+
+
+def requested(argv=None, environ=None):
+    """The profiling request from the command line or environment.
+
+    Returns None when profiling is off, "" for a summary only, or the
+    output path.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    environ = os.environ if environ is None else environ
+    for arg in argv:
+        if arg == FLAG:
+            return ""
+        if arg.startswith(FLAG + "="):
+            return arg[len(FLAG) + 1:]
+    value = environ.get(ENV_VAR)
+    if value is None or value in ("", "0"):
+        return None
+    return "" if value == "1" else value
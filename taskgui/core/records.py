@@ -0,0 +1,197 @@
+"""Compact record types for planner tasks, TaskEase items and calendar events.
+
+In memory each record is a ``__slots__`` object instead of a dict, and the
+category, priority and status fields hold shared enum members (or interned
+strings for labels outside the enum), so a million tasks share one copy of
+each label. Times and dates are parsed once and cached, so repeated values
+are shared too. JSON stays the on-disk format: ``from_dict``/``to_dict``
+convert at the storage boundary, and ``to_json`` plugs into
+``json.dump(..., default=to_json)``.
+"""
+
+import sys
+from datetime import datetime, time
+from enum import Enum
+from functools import lru_cache
+
+from taskgui.core.dates import parse_date_key
+from taskgui.core.recurrence import Rule
+from taskgui.core.scheduler import parse_event_key
+
+
+class Label(str, Enum):
+    """A string enum that compares, displays and serializes as its value."""
+
+    def __str__(self):
+        return self.value
+
+    def __format__(self, spec):
+        return format(self.value, spec)
+
+    @classmethod
+    def parse(cls, value):
+        try:
+            return cls(value)
+        except ValueError:
+            # Labels from older data or other tools are kept, just interned
+            return sys.intern(str(value))
+
+
+class Category(Label):
+    GENERAL = "General"
+    WORK = "Work"
+    STUDY = "Study"
+    PERSONAL = "Personal"
+    LINUX = "Linux"
+
+
+class Priority(Label):
+    HIGH = "High"
+    NORMAL = "Normal"
+    LOW = "Low"
+
+
+class Status(Label):
+    PENDING = "Pending"
+    DONE = "Done"
+
+
+@lru_cache(maxsize=4096)
+def parse_time(text):
+    """Parse ``"9:05"``/``"09:05"`` to a ``time``; other text is kept as is."""
+    hours, sep, minutes = text.strip().partition(":")
+    if sep and hours.isdigit() and minutes.isdigit() and len(minutes) == 2:
+        hours, minutes = int(hours), int(minutes)
+        if hours < 24 and minutes < 60:
+            return time(hours, minutes)
+    return sys.intern(text)
+
+
+def format_time(value):
+    return value.strftime("%H:%M") if isinstance(value, time) else value
+
+
+def time_sort_key(value):
+    # Parsed times first in clock order, unparseable text after them
+    return (0, value) if isinstance(value, time) else (1, value)
+
+
+def to_json(record):
+    """``default`` hook for ``json.dump`` that serializes records."""
+    try:
+        return record.to_dict()
+    except AttributeError:
+        raise TypeError(f"{type(record).__name__} is not JSON serializable") from None
+
+
+class PlannerTask:
+    """One task in the Linux Pro Planner; ``date`` comes from its day key."""
+
+    __slots__ = ("id", "date", "time", "text", "category", "priority", "status")
+
+    def __init__(self, text, time="00:00", category=Category.GENERAL,
+                 priority=Priority.NORMAL, status=Status.PENDING, id=None, date=None):
+        self.id = id
+        self.date = date
+        self.time = parse_time(time)
+        self.text = text
+        self.category = Category.parse(category)
+        self.priority = Priority.parse(priority)
+        self.status = Status.parse(status)
+
+    @classmethod
+    def from_dict(cls, data, date_key=None):
+        return cls(
+            data.get("task", ""),
+            time=data.get("time", "00:00"),
+            category=data.get("category", Category.GENERAL),
+            priority=data.get("priority", Priority.NORMAL),
+            status=data.get("status", Status.PENDING),
+            id=data.get("id"),
+            date=parse_date_key(date_key) if date_key else None,
+        )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "time": format_time(self.time),
+            "task": self.text,
+            "category": str(self.category),
+            "priority": str(self.priority),
+            "status": str(self.status),
+        }
+
+    def row(self):
+        """The values shown in the planner's task table."""
+        return (format_time(self.time), self.text, self.category, self.priority, self.status)
+
+
+class TodoItem:
+    """One TaskEase task."""
+
+    __slots__ = ("title", "note", "done")
+
+    def __init__(self, title, note="", done=False):
+        self.title = title
+        self.note = note
+        self.done = done
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("title", ""), data.get("note", ""), bool(data.get("done")))
+
+    def to_dict(self):
+        return {"title": self.title, "note": self.note, "done": self.done}
+
+
+class Event:
+    """One calendar event; ``when`` is parsed from its key.
+
+    A recurring event keeps its first occurrence as ``when`` and a ``Rule``
+    in ``rule``; ``fired`` is the last occurrence whose alarm went off, and
+    ``alerted`` is only set once the series has ended.
+    """
+
+    __slots__ = ("text", "color", "alerted", "when", "rule", "fired")
+
+    def __init__(self, text, color="#90caf9", alerted=False, when=None, rule=None, fired=None):
+        self.text = text
+        self.color = sys.intern(color)
+        self.alerted = alerted
+        self.when = when
+        self.rule = rule
+        self.fired = fired
+
+    @classmethod
+    def from_dict(cls, data, key=None):
+        return cls(
+            data.get("text", ""),
+            color=data.get("color", "#90caf9"),
+            alerted=bool(data.get("alerted")),
+            when=parse_event_key(key) if key else None,
+            rule=Rule.from_dict(data["repeat"]) if data.get("repeat") else None,
+            fired=datetime.fromisoformat(data["fired"]) if data.get("fired") else None,
+        )
+
+    def to_dict(self):
+        data = {"text": self.text, "color": self.color, "alerted": self.alerted}
+        if self.rule is not None:
+            data["repeat"] = self.rule.to_dict()
+        if self.fired is not None:
+            data["fired"] = self.fired.isoformat(" ")
+        return data
+
+    def next_due(self, now):
+        """When the alarm should next fire: a one-off event's time, even if
+        already past (so missed alarms are caught up), or for a series the
+        latest occurrence up to ``now`` if it has not fired yet, otherwise
+        the next one after ``now``. Only one missed occurrence is caught up.
+        """
+        if self.alerted or self.when is None:
+            return None
+        if self.rule is None:
+            return self.when
+        last = self.rule.last_until(self.when, now)
+        if last is not None and (self.fired is None or last > self.fired):
+            return last
+        return self.rule.next_after(self.when, now)
@@ -0,0 +1,227 @@
+"""Recurrence rules and lazily expanded occurrences.
+
+A recurring item is stored once, as its first occurrence plus a ``Rule``.
+Occurrences are never materialized in bulk: ``Rule.between`` and
+``Rule.next_after`` walk only as far as the window they are asked about
+(jumping straight to it when the rule has no ``count``), and
+``OccurrenceCache`` keeps the expansion of recently shown months until a
+series changes.
+"""
+
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+
+FREQUENCIES = ("daily", "weekly", "monthly", "yearly")
+
+# Roughly one period of each frequency, for looking back from a date
+PERIOD_DAYS = {"daily": 1, "weekly": 7, "monthly": 31, "yearly": 366}
+
+# A rule whose periods stop producing dates (e.g. daily every 7 days but
+# only on a weekday the series never lands on) ends after this many.
+MAX_EMPTY_PERIODS = 1000
+
+
+def _parse_date(text):
+    return date.fromisoformat(text)
+
+
+class Rule:
+    """How a series repeats after its first occurrence.
+
+    ``freq`` is one of ``FREQUENCIES``, every ``interval`` periods.
+    ``weekdays`` (0 = Monday) picks the days of each week for weekly rules
+    and filters the days of daily rules. Monthly and yearly rules repeat on
+    the first occurrence's day and skip months that lack it. ``count``
+    caps the number of occurrences, ``until`` is the last allowed date, and
+    ``exceptions`` holds dates that are skipped (they still count towards
+    ``count``, as in iCalendar).
+    """
+
+    __slots__ = ("freq", "interval", "weekdays", "count", "until", "exceptions")
+
+    def __init__(self, freq, interval=1, weekdays=None, count=None, until=None, exceptions=()):
+        if freq not in FREQUENCIES:
+            raise ValueError(f"unknown frequency {freq!r}")
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        self.freq = freq
+        self.interval = interval
+        self.weekdays = tuple(sorted(set(weekdays))) if weekdays else None
+        self.count = count
+        self.until = until
+        self.exceptions = set(exceptions)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data["freq"],
+            interval=data.get("interval", 1),
+            weekdays=data.get("weekdays"),
+            count=data.get("count"),
+            until=_parse_date(data["until"]) if data.get("until") else None,
+            exceptions=(_parse_date(d) for d in data.get("exceptions", ())),
+        )
+
+    def to_dict(self):
+        data = {"freq": self.freq}
+        if self.interval != 1:
+            data["interval"] = self.interval
+        if self.weekdays:
+            data["weekdays"] = list(self.weekdays)
+        if self.count is not None:
+            data["count"] = self.count
+        if self.until is not None:
+            data["until"] = self.until.isoformat()
+        if self.exceptions:
+            data["exceptions"] = sorted(d.isoformat() for d in self.exceptions)
+        return data
+
+    def between(self, start, lo, hi):
+        """Yield the occurrences of a series first due at ``start`` in ``[lo, hi)``."""
+        for when in self._iter_from(start, lo):
+            if when >= hi:
+                return
+            yield when
+
+    def next_after(self, start, after):
+        """The first occurrence strictly after ``after``, or None if the series ended."""
+        for when in self._iter_from(start, after):
+            if when > after:
+                return when
+        return None
+
+    def last_until(self, start, at):
+        """The last occurrence at or before ``at``, or None if there is none yet."""
+        span = timedelta(days=PERIOD_DAYS[self.freq] * self.interval)
+        hi = at + timedelta(microseconds=1)
+        while True:
+            # Widen the window back from ``at`` until it holds an occurrence
+            lo = max(start, at - span)
+            last = None
+            for last in self.between(start, lo, hi):
+                pass
+            if last is not None or lo == start:
+                return last
+            span *= 2
+
+    def occurs_on(self, start, day):
+        lo = datetime.combine(day, datetime.min.time())
+        return next(self.between(start, lo, lo + timedelta(days=1)), None) is not None
+
+    # ---- internals ----
+
+    def _iter_from(self, start, lo):
+        k = self._first_period(start, lo)
+        emitted = 0
+        empty = 0
+        while empty < MAX_EMPTY_PERIODS:
+            found = False
+            for when in self._period(start, k):
+                if when < start:
+                    continue
+                if self.until is not None and when.date() > self.until:
+                    return
+                if self.count is not None:
+                    if emitted >= self.count:
+                        return
+                    emitted += 1
+                found = True
+                if when >= lo and when.date() not in self.exceptions:
+                    yield when
+            empty = 0 if found else empty + 1
+            k += 1
+
+    def _first_period(self, start, lo):
+        """Index of a period at or before the one holding ``lo``.
+
+        Counted rules always start from the first period so ``count`` is
+        applied to the whole series.
+        """
+        if self.count is not None or lo <= start:
+            return 0
+        if self.freq == "daily":
+            return (lo - start).days // self.interval
+        if self.freq == "weekly":
+            monday = start.date() - timedelta(days=start.weekday())
+            return (lo.date() - monday).days // 7 // self.interval
+        if self.freq == "monthly":
+            return ((lo.year - start.year) * 12 + lo.month - start.month) // self.interval
+        return (lo.year - start.year) // self.interval
+
+    def _period(self, start, k):
+        """Candidate occurrences of period ``k`` (0 holds ``start``), in order."""
+        if self.freq == "daily":
+            when = start + timedelta(days=k * self.interval)
+            if self.weekdays is None or when.weekday() in self.weekdays:
+                return (when,)
+            return ()
+        if self.freq == "weekly":
+            monday = start + timedelta(days=7 * k * self.interval - start.weekday())
+            return tuple(monday + timedelta(days=d) for d in self.weekdays or (start.weekday(),))
+        if self.freq == "monthly":
+            months = start.month - 1 + k * self.interval
+            year, month = start.year + months // 12, months % 12 + 1
+        else:
+            year, month = start.year + k * self.interval, start.month
+        try:
+            return (start.replace(year=year, month=month),)
+        except ValueError:
+            return ()  # e.g. the 31st in a 30-day month, or Feb 29
+
+
+class OccurrenceCache:
+    """Occurrences of a set of series, expanded one month at a time.
+
+    ``month(year, month)`` maps each day to the keys of the series that
+    occur on it. Up to ``max_months`` expansions are kept; any change to a
+    series (``set``, ``discard`` or ``invalidate`` after editing a rule in
+    place) drops them all, since they are cheap to redo for one month.
+    """
+
+    def __init__(self, max_months=24):
+        self.max_months = max_months
+        self._series = {}  # key -> (start datetime, Rule)
+        self._months = OrderedDict()  # (year, month) -> {day: [key, ...]}
+
+    def __len__(self):
+        return len(self._series)
+
+    def __contains__(self, key):
+        return key in self._series
+
+    def items(self):
+        return self._series.items()
+
+    def set(self, key, start, rule):
+        self._series[key] = (start, rule)
+        self.invalidate()
+
+    def discard(self, key):
+        if self._series.pop(key, None) is not None:
+            self.invalidate()
+
+    def invalidate(self):
+        self._months.clear()
+
+    def month(self, year, month):
+        key = (year, month)
+        days = self._months.get(key)
+        if days is not None:
+            self._months.move_to_end(key)
+            return days
+
+        lo = datetime(year, month, 1)
+        hi = datetime(year + month // 12, month % 12 + 1, 1)
+        days = {}
+        for series_key, (start, rule) in self._series.items():
+            for when in rule.between(start, lo, hi):
+                days.setdefault(when.day, []).append(series_key)
+
+        self._months[key] = days
+        while len(self._months) > self.max_months:
+            self._months.popitem(last=False)
+        return days
+
+    def on_day(self, day):
+        """Keys of the series occurring on ``day`` (a ``date``)."""
+        return self.month(day.year, day.month).get(day.day, [])
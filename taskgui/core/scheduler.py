@@ -0,0 +1,102 @@
+"""Heap-based reminder scheduling for the calendar apps."""
+
+import heapq
+from datetime import datetime
+
+from taskgui.core.dates import DateKey
+
+
+def parse_event_key(key):
+    """Return the datetime encoded in an event key, or None if it is malformed.
+
+    Only timed keys are event keys. A date-only key such as "2026-01-05"
+    (the event calendar's, which can share events.json) gives None, so
+    it is never scheduled as a midnight alarm.
+    """
+    try:
+        key = DateKey.parse(key)
+    except ValueError:
+        return None
+    return None if key.all_day else key.when
+
+
+class ReminderScheduler:
+    """Pending alarms kept in a min-heap ordered by due time.
+
+    Keys are parsed once when they are added, so finding the next alarm is
+    O(1) and popping due alarms is O(log n) each, however many events exist.
+    Removal is lazy: ``remove`` forgets the key and the stale heap entry is
+    dropped when it reaches the top.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._due = {}  # key -> due datetime of the live heap entry
+
+    def __len__(self):
+        return len(self._due)
+
+    def __contains__(self, key):
+        return key in self._due
+
+    def load(self, events, now=None):
+        """Rebuild the heap from a dict of ``Event`` records, skipping alerted ones.
+
+        Recurring events are scheduled at their next occurrence after ``now``.
+        """
+        now = now or datetime.now()
+        self._due = {}
+        for key, event in events.items():
+            due = event.next_due(now)
+            if due is not None:
+                self._due[key] = due
+        self._heap = [(due, key) for key, due in self._due.items()]
+        heapq.heapify(self._heap)
+
+    def add(self, key, due=None):
+        """Schedule (or reschedule) the alarm for ``key``."""
+        if due is None:
+            due = parse_event_key(key)
+            if due is None:
+                return False
+        if self._due.get(key) == due:
+            return True
+        self._due[key] = due
+        heapq.heappush(self._heap, (due, key))
+        self._compact()
+        return True
+
+    def remove(self, key):
+        self._due.pop(key, None)
+
+    def next_due(self):
+        """Return the earliest pending due time, or None if nothing is pending."""
+        self._prune()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now):
+        """Remove and return the keys of every alarm due at or before ``now``.
+
+        Alarms whose time passed while the app was closed or the machine was
+        asleep are returned too, oldest first.
+        """
+        fired = []
+        while self._heap and self._heap[0][0] <= now:
+            due, key = heapq.heappop(self._heap)
+            if self._due.get(key) == due:
+                del self._due[key]
+                fired.append(key)
+        return fired
+
+    def _prune(self):
+        while self._heap:
+            due, key = self._heap[0]
+            if self._due.get(key) == due:
+                return
+            heapq.heappop(self._heap)
+
+    def _compact(self):
+        # Stale entries pile up when the same events are edited repeatedly
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [(due, key) for key, due in self._due.items()]
+            heapq.heapify(self._heap)
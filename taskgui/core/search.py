@@ -0,0 +1,106 @@
+"""Tokenized inverted index for task search."""
+
+import re
+from bisect import bisect_left, insort
+
+TOKEN_RE = re.compile(r"\w+")
+LAST_CHAR = chr(0x10FFFF)  # sorts after any character a token can continue with
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.casefold())
+
+
+class SearchIndex:
+    """Maps tokens to the keys of the documents containing them.
+
+    Documents are indexed once, when added or edited, so a query never
+    touches the text of documents that cannot match. Every query term
+    matches tokens that start with it, and all terms must match
+    (``"buy mi"`` finds "Buy milk").
+    """
+
+    def __init__(self):
+        self._postings = {}  # token -> set of keys
+        self._tokens = {}    # key -> tokens of that document
+        self._vocab = []     # sorted tokens, for prefix lookups
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def clear(self):
+        self._postings.clear()
+        self._tokens.clear()
+        self._vocab.clear()
+
+    def add(self, key, *texts):
+        for token in self._index(key, texts):
+            insort(self._vocab, token)
+
+    def add_many(self, documents):
+        """Index ``(key, text, ...)`` tuples, sorting their new tokens in once."""
+        new = []
+        for key, *texts in documents:
+            new.extend(self._index(key, texts))
+        if new:
+            # Two sorted runs: the sort merges them in linear time
+            self._vocab.extend(sorted(new))
+            self._vocab.sort()
+
+    def rebuild(self, documents):
+        self.clear()
+        self.add_many(documents)
+
+    def remove(self, key):
+        for token in self._tokens.pop(key, ()):
+            keys = self._postings[token]
+            keys.discard(key)
+            if not keys:
+                del self._postings[token]
+                del self._vocab[bisect_left(self._vocab, token)]
+
+    def update(self, key, *texts):
+        self.remove(key)
+        self.add(key, *texts)
+
+    def search(self, query):
+        """Return the set of keys matching every term, or None for an empty query."""
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return None
+
+        result = None
+        # Longest terms first: they tend to match the fewest documents
+        for term in terms:
+            matches = self._prefix_matches(term)
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        return result
+
+    # ---- internals ----
+
+    def _index(self, key, texts):
+        """Post ``key`` under its tokens; returns the tokens new to the index."""
+        tokens = set()
+        for text in texts:
+            tokens.update(tokenize(text))
+        self._tokens[key] = tokens
+
+        new = []
+        for token in tokens:
+            keys = self._postings.get(token)
+            if keys is None:
+                keys = self._postings[token] = set()
+                new.append(token)
+            keys.add(key)
+        return new
+
+    def _prefix_matches(self, prefix):
+        start = bisect_left(self._vocab, prefix)
+        end = bisect_left(self._vocab, prefix + LAST_CHAR, start)
+
+        matches = set()
+        for token in self._vocab[start:end]:
+            matches |= self._postings[token]
+        return matches
@@ -0,0 +1,191 @@
+"""Date-keyed data stored as one JSON file per month, loaded on demand.
+
+``MonthShards`` behaves like the ``{"2026-1-5": [...]}`` dicts the planner
+apps used to load in full (any key spelling is accepted, and stored in the
+canonical ``"2026-01-05"`` form), but each month lives in its own
+``YYYY-MM.json`` file under ``directory`` and is only read the first time
+a key in that month is touched. Recently used months stay in an LRU
+cache of ``cache_size`` entries, so start-up cost does not depend on how
+many years of history exist.
+
+A legacy single-file JSON is split into shards once, the first time the
+directory is missing.
+"""
+
+import json
+import os
+from collections import OrderedDict
+
+from taskgui.core.dates import normalize_key, normalize_keys
+from taskgui.core.storage import atomic_write_json
+
+
+def month_of(date_key):
+    year, month, _ = date_key.split("-", 2)
+    return int(year), int(month)
+
+
+class MonthShards:
+    """Mapping of date keys to values, backed by per-month JSON files.
+
+    Call ``changed(date_key)`` after modifying a value so its month is
+    written (through ``saver`` when given); ``default`` is passed to
+    ``json.dump`` for values that are not plain JSON. ``on_load(key, data)`` and
+    ``on_evict(key, data)`` let callers keep their own indexes in step with
+    the months held in memory; ``key`` is ``(year, month)``.
+    """
+
+    def __init__(self, directory, legacy_path=None, cache_size=12, saver=None,
+                 indent=None, default=None, on_load=None, on_evict=None):
+        self.directory = directory
+        self.cache_size = cache_size
+        self.saver = saver
+        self.indent = indent
+        self.default = default
+        self.on_load = on_load
+        self.on_evict = on_evict
+        self._months = OrderedDict()  # (year, month) -> {date_key: value}
+        self._dirty = set()      # months changed but not yet handed to the saver
+        self._in_flight = set()  # handed over, the write possibly still queued
+        self._pinned = None
+
+        if not os.path.isdir(directory):
+            self._migrate(legacy_path)
+
+    # ---- dict-like access by date key ----
+
+    def __contains__(self, date_key):
+        return normalize_key(date_key) in self.month(*month_of(date_key))
+
+    def __getitem__(self, date_key):
+        return self.month(*month_of(date_key))[normalize_key(date_key)]
+
+    def __setitem__(self, date_key, value):
+        self.month(*month_of(date_key))[normalize_key(date_key)] = value
+
+    def __delitem__(self, date_key):
+        del self.month(*month_of(date_key))[normalize_key(date_key)]
+
+    def get(self, date_key, default=None):
+        return self.month(*month_of(date_key)).get(normalize_key(date_key), default)
+
+    def setdefault(self, date_key, default):
+        return self.month(*month_of(date_key)).setdefault(normalize_key(date_key), default)
+
+    def pop(self, date_key, *default):
+        return self.month(*month_of(date_key)).pop(normalize_key(date_key), *default)
+
+    # ---- months ----
+
+    def month(self, year, month):
+        """Return the (cached) dict of one month, loading its shard if needed."""
+        key = (year, month)
+        data = self._months.get(key)
+        if data is not None:
+            self._months.move_to_end(key)
+            return data
+
+        if key in self._in_flight:
+            # Its last save may still be queued on the writer thread
+            self.saver.worker.flush()
+            self._in_flight.clear()
+        data = self._read(key)
+        self._months[key] = data
+        if normalize_keys(data):
+            self.changed(next(iter(data)))
+        if self.on_load is not None:
+            self.on_load(key, data)
+        self._evict()
+        return data
+
+    def pin(self, year, month):
+        """Keep one month in memory regardless of the LRU (e.g. the selected day)."""
+        self._pinned = (year, month)
+        self.month(year, month)
+
+    def changed(self, date_key):
+        """Persist the month holding ``date_key`` after it was modified."""
+        key = month_of(date_key)
+        data = self._months[key]
+        path = self._path(key)
+        if self.saver is not None:
+            self._dirty.add(key)
+            self.saver.request(path, lambda: self._snapshot(key, data))
+        else:
+            self._write(key, data)
+
+    def loaded_months(self):
+        return list(self._months)
+
+    # ---- internals ----
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key[0]:04d}-{key[1]:02d}.json")
+
+    def _read(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _snapshot(self, key, data):
+        # Copied on the GUI thread, serialized on the writer thread; from
+        # here on the saver owns the write, so eviction needs none
+        self._dirty.discard(key)
+        self._in_flight.add(key)
+        days = {k: list(v) if isinstance(v, list) else v for k, v in data.items()}
+        return lambda: json.dumps(days, indent=self.indent, default=self.default)
+
+    def _write(self, key, data):
+        os.makedirs(self.directory, exist_ok=True)
+        if data:
+            atomic_write_json(self._path(key), data, indent=self.indent, default=self.default)
+        elif os.path.exists(self._path(key)):
+            os.remove(self._path(key))
+
+    def _evict(self):
+        while len(self._months) > self.cache_size:
+            for key in self._months:
+                if key != self._pinned:
+                    break
+            data = self._months.pop(key)
+            if key in self._dirty:
+                # Its save is still waiting out the coalescing delay; write
+                # now so reloading the month later reads current data.
+                self._dirty.discard(key)
+                self._write(key, data)
+            if self.on_evict is not None:
+                self.on_evict(key, data)
+
+    def _migrate(self, legacy_path):
+        data = {}
+        if legacy_path and os.path.exists(legacy_path):
+            try:
+                with open(legacy_path, "r") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+        if not isinstance(data, dict):
+            data = {}
+
+        months = {}
+        for date_key, value in data.items():
+            try:
+                key = month_of(date_key)
+            except ValueError:
+                continue
+            months.setdefault(key, {})[date_key] = value
+
+        # Build the shards next to the target and rename, so an interrupted
+        # migration is simply redone next time.
+        staging = self.directory + ".tmp"
+        os.makedirs(staging, exist_ok=True)
+        for key, month_data in months.items():
+            normalize_keys(month_data)
+            name = os.path.basename(self._path(key))
+            atomic_write_json(os.path.join(staging, name), month_data, indent=self.indent)
+        os.replace(staging, self.directory)
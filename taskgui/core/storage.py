@@ -0,0 +1,306 @@
+"""Pluggable storage backends for the calendar event dicts.
+
+Both stores own the dict returned by ``load()``; callers change it through
+``put``/``delete`` so the backend can persist each change its own way.
+Values may be records rather than plain JSON: ``decode(key, value)`` turns
+each loaded value into one, and ``default`` is the ``json.dump`` hook that
+turns it back.
+"""
+
+import json
+import os
+
+
+def _umask():
+    # Read once at import, while no writer thread can create files under
+    # the temporarily cleared mask
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _umask()
+
+
+def file_mode(path):
+    """The permissions a replacement for ``path`` should get.
+
+    Temp files are created 0600; a save keeps the mode of the file it
+    replaces, and a new file gets the usual umask default.
+    """
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def _atomic_write(path, write):
+    """Call ``write(f)`` on a temp file next to ``path``, then rename it into place."""
+    import tempfile  # deferred with its shutil/random imports until the first save
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "w") as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path, data, **dump_kwargs):
+    _atomic_write(path, lambda f: json.dump(data, f, **dump_kwargs))
+
+
+def atomic_write_text(path, text):
+    _atomic_write(path, lambda f: f.write(text))
+
+
+def partition_path(directory, key, suffix=".json"):
+    """The file holding ``key``'s partition under ``directory``.
+
+    Keys are percent-escaped, so every string (an e-mail address, say) gets
+    its own file name and none can reach outside ``directory``.
+    """
+    from urllib.parse import quote
+    return os.path.join(directory, quote(key, safe="@") + suffix)
+
+
+def _decode_all(data, decode):
+    if decode is not None:
+        for key, value in data.items():
+            data[key] = decode(key, value)
+
+
+class JsonFileStore:
+    """The original format: every change rewrites the whole JSON file."""
+
+    def __init__(self, path, indent=4, decode=None, default=None):
+        self.path = path
+        self.indent = indent
+        self.decode = decode
+        self.default = default
+        self.data = {}
+
+    def load(self):
+        self.data = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r") as f:
+                self.data = json.load(f)
+        _decode_all(self.data, self.decode)
+        return self.data
+
+    def put(self, key, value):
+        self.data[key] = value
+        self.compact()
+
+    def delete(self, key):
+        if self.data.pop(key, None) is not None:
+            self.compact()
+
+    def compact(self):
+        atomic_write_json(self.path, self.data, indent=self.indent, default=self.default)
+
+    def close(self):
+        pass
+
+
+def read_journal(path, log_path=None):
+    """A ``JournalStore``'s dict, read without changing either file.
+
+    The snapshot is read and the log's complete records replayed on top;
+    a record torn by a crash mid-append is skipped, not truncated away,
+    so a running app's files are safe to read.
+    """
+    data = {}
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            data = json.load(f)
+    log_path = log_path or path + ".log"
+    if os.path.exists(log_path):
+        with open(log_path, "rb") as f:
+            raw = f.read()
+        _apply_log(data, raw[:raw.rfind(b"\n") + 1])
+    return data
+
+
+def _apply_log(data, raw, keys=None):
+    """Apply the put/delete records in ``raw`` to ``data``; returns how many.
+
+    The keys they change are added to the set ``keys``, if one is given.
+    """
+    count = 0
+    for line in raw.splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if record.get("op") == "put":
+            data[record["key"]] = record["value"]
+        elif record.get("op") == "delete":
+            data.pop(record["key"], None)
+        else:
+            continue
+        if keys is not None:
+            keys.add(record["key"])
+        count += 1
+    return count
+
+
+class JournalStore:
+    """A JSON snapshot plus an append-only JSON Lines change log.
+
+    Each ``put``/``delete`` appends one record to the log, so an edit costs
+    O(1) I/O. Once the log holds ``compact_every`` records the dict is
+    written to a new snapshot (temp file + rename) and the log is emptied.
+    Loading reads the snapshot and replays the log on top of it. Records
+    are absolute puts and deletes, so replaying a log whose compaction was
+    interrupted gives the same result.
+
+    Other apps may save the snapshot file too (``SyncedRecords`` in
+    ``taskgui.core.sync``), so compaction holds the same ``<path>.lock``
+    and re-reads the file first: keys not changed here since the last
+    compaction take the file's version, written back as found. Those
+    changes are passed to ``on_merge({key: (old, new)})``, with None for a
+    missing side.
+    """
+
+    def __init__(self, path, log_path=None, compact_every=1000, fsync=False, indent=4,
+                 decode=None, default=None, on_merge=None):
+        self.path = path
+        self.log_path = log_path or path + ".log"
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self.indent = indent
+        self.decode = decode
+        self.default = default
+        self.on_merge = on_merge
+        self.data = {}
+        self._log = None
+        self._pending = 0  # records in the log since the last snapshot
+        self._touched = set()  # keys put or deleted since the last snapshot
+
+    def load(self):
+        self.data = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r") as f:
+                self.data = json.load(f)
+
+        self._touched = set()
+        self._pending = self._replay()
+        _decode_all(self.data, self.decode)
+        self._open_log()
+        if self._pending >= self.compact_every:
+            # The caller has not seen the data yet; nothing to report
+            self._compact()
+        return self.data
+
+    def put(self, key, value):
+        self.data[key] = value
+        self._touched.add(key)
+        self._append({"op": "put", "key": key, "value": value})
+
+    def delete(self, key):
+        if key in self.data:
+            del self.data[key]
+            self._touched.add(key)
+            self._append({"op": "delete", "key": key})
+
+    def compact(self):
+        changes = self._compact()
+        if changes and self.on_merge is not None:
+            self.on_merge(changes)
+
+    def close(self):
+        if self._log is None:
+            return
+        if self._pending:
+            self.compact()
+        self._log.close()
+        self._log = None
+
+    # ---- internals ----
+
+    def _compact(self):
+        from taskgui.core.sync import locked  # sync imports this module
+        with locked(self.path):
+            snapshot, changes = self._merge(self._read_snapshot())
+            atomic_write_json(self.path, snapshot, indent=self.indent, default=self.default)
+        if self._log is not None:
+            self._log.close()
+        # Truncate only after the new snapshot is in place
+        self._log = open(self.log_path, "w")
+        self._pending = 0
+        self._touched = set()
+        return changes
+
+    def _read_snapshot(self):
+        try:
+            with open(self.path, "r") as f:
+                disk = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            return None  # cut short or not ours; ours is written over it
+        return disk if isinstance(disk, dict) else None
+
+    def _merge(self, disk):
+        """The snapshot to write, and the changes made to ``data`` for it."""
+        snapshot = dict(self.data)
+        changes = {}
+        if disk is None:
+            return snapshot, changes
+        for key in (set(disk) | set(self.data)) - self._touched:
+            old = self.data.get(key)
+            if key not in disk:
+                del self.data[key]
+                del snapshot[key]
+                changes[key] = (old, None)
+                continue
+            # Kept as found, with any fields this app does not know
+            snapshot[key] = raw = disk[key]
+            new = self.decode(key, raw) if self.decode is not None else raw
+            if old is None or self._plain(old) != self._plain(new):
+                self.data[key] = new
+                changes[key] = (old, new)
+        return snapshot, changes
+
+    def _plain(self, value):
+        return json.dumps(value, default=self.default, sort_keys=True)
+
+    def _replay(self):
+        if not os.path.exists(self.log_path):
+            return 0
+
+        with open(self.log_path, "rb") as f:
+            raw = f.read()
+
+        # Drop a record torn by a crash mid-append so new records start clean
+        end = raw.rfind(b"\n") + 1
+        if end != len(raw):
+            with open(self.log_path, "r+b") as f:
+                f.truncate(end)
+            raw = raw[:end]
+
+        return _apply_log(self.data, raw, self._touched)
+
+    def _open_log(self):
+        if self._log is None:
+            self._log = open(self.log_path, "a")
+
+    def _append(self, record):
+        self._open_log()
+        self._log.write(json.dumps(record, default=self.default) + "\n")
+        self._log.flush()
+        if self.fsync:
+            os.fsync(self._log.fileno())
+
+        self._pending += 1
+        if self._pending >= self.compact_every:
+            self.compact()
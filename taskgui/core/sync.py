@@ -0,0 +1,305 @@
+"""Sharing one JSON record file between several running windows.
+
+``SyncedRecords`` keeps a ``{key: record dict}`` file and the dict loaded
+from it in step with other processes editing the same file. Each record
+carries a ``"rev"`` stamp, raised by one on every local edit. The
+instance remembers the stamps it last saw on disk and which keys it has
+changed since, so it can reload just the records that changed on disk:
+
+- a key changed on disk but not locally takes the disk version (or is
+  dropped, if it was deleted there);
+- a key changed on both sides keeps the higher stamp, the local edit
+  winning a tie;
+- a key changed only locally is kept and written with the next commit.
+
+``commit()`` reads, merges and writes while holding an exclusive
+``fcntl`` lock on ``<path>.lock``, so two instances saving at once can
+no longer overwrite each other's records. Where ``fcntl`` is missing
+(Windows) the lock is skipped. To keep a slow disk or a held lock off
+the GUI thread, ``prepare()`` copies what to save and returns a job that
+does the locked part on any thread; its result goes back to
+``finish()`` on the thread that owns the records. ``refresh()`` splits
+the same way, into ``fetch()`` and ``take()``.
+
+External writes are noticed by comparing ``file_signature`` (inode,
+size and mtime) with the one recorded at the last load or commit;
+``Inotify`` lets a Linux event loop wait for the write instead of
+polling for it.
+"""
+
+import json
+import os
+import sys
+from contextlib import contextmanager
+
+from taskgui.core.storage import atomic_write_json
+
+REV = "rev"
+
+
+def file_signature(path):
+    """``(inode, size, mtime_ns)`` of ``path``, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+@contextmanager
+def locked(path, shared=False):
+    """Hold an advisory lock on ``path`` for the ``with`` block.
+
+    The lock is taken on ``<path>.lock``, not on the data file, because
+    saves replace the data file with a new one.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+    fd = os.open(path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)  # closing releases the lock
+
+
+class SyncedRecords:
+
+    def __init__(self, path, indent=4):
+        self.path = path
+        self.indent = indent
+        self.records = {}
+        self.signature = None
+        self._base = {}     # key -> rev last seen on disk
+        self._dirty = {}    # key -> rev of the local edit not yet committed
+
+    def load(self):
+        """Read the file; returns the records dict, which stays the same object."""
+        with locked(self.path, shared=True):
+            disk, self.signature = self._read()
+        disk = disk or {}
+        self.records.clear()
+        self.records.update(disk)
+        self._base = {key: rev_of(record) for key, record in disk.items()}
+        self._dirty.clear()
+        return self.records
+
+    def touch(self, key):
+        """Note that ``records[key]`` was set or deleted here; stamps it."""
+        rev = max(self._base.get(key) or 0, self._dirty.get(key, 0)) + 1
+        record = self.records.get(key)
+        if record is not None:
+            record[REV] = rev = max(rev, rev_of(record) + 1)
+        self._dirty[key] = rev
+
+    def changed_on_disk(self):
+        return file_signature(self.path) != self.signature
+
+    def refresh(self):
+        """Merge in records another process saved; returns the keys that changed here."""
+        if not self.changed_on_disk():
+            return set()
+        return self.take(self.fetch())
+
+    def fetch(self):
+        """Read the file under the shared lock, on any thread; hand the result to ``take``."""
+        with locked(self.path, shared=True):
+            return self._read()
+
+    def take(self, fetched):
+        """Merge in what ``fetch`` read; returns the keys that changed here."""
+        disk, signature = fetched
+        if disk is None or signature == self.signature:
+            return set()
+        changed = self._merge(disk)
+        self.signature = signature
+        return changed
+
+    def commit(self):
+        """Merge the file's latest records and write ours, under the lock.
+
+        Returns the keys that changed here because of the merge.
+        """
+        return self.finish(self.prepare()())
+
+    def prepare(self):
+        """Copy the state a commit needs; returns the job that does the commit.
+
+        The job touches only the copies, so it can run on another thread
+        while editing goes on here. Hand its result to ``finish``.
+        """
+        records = dict(self.records)
+        base = dict(self._base)
+        committed = dict(self._dirty)
+        dirty = dict(committed)  # the merge may drop edits from this one
+        signature = self.signature
+
+        def commit():
+            changed = set()
+            with locked(self.path):
+                if file_signature(self.path) != signature:
+                    disk, _ = self._read()
+                    if disk is not None:
+                        changed = merge(records, base, dirty, disk)
+                atomic_write_json(self.path, records, indent=self.indent)
+                written = file_signature(self.path)
+            return records, changed, committed, written
+
+        return commit
+
+    def finish(self, result):
+        """Take in a commit's result; returns the keys that changed here because of it.
+
+        Keys edited again since ``prepare`` keep the newer edit, still
+        pending for the next commit.
+        """
+        records, merged, committed, signature = result
+        changed = set()
+        for key in merged:
+            if self._dirty.get(key) != committed.get(key):
+                continue
+            if key in records:
+                self.records[key] = records[key]
+            else:
+                self.records.pop(key, None)
+            changed.add(key)
+        for key, rev in committed.items():
+            if self._dirty.get(key) == rev:
+                del self._dirty[key]
+        self._base = {key: rev_of(record) for key, record in records.items()}
+        self.signature = signature
+        return changed
+
+    def pending(self):
+        return bool(self._dirty)
+
+    # ---- internals ----
+
+    def _read(self):
+        # The signature is taken first: a write landing in between makes it
+        # stale, and the next check reads the file again
+        signature = file_signature(self.path)
+        if signature is None:
+            return {}, None
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f), signature
+        except FileNotFoundError:
+            return {}, None
+        except ValueError:
+            # Not ours or cut short; nothing is merged from it
+            return None, signature
+
+    def _merge(self, disk):
+        return merge(self.records, self._base, self._dirty, disk)
+
+
+def merge(records, base, dirty, disk):
+    """Merge ``disk`` into ``records``; returns the keys that changed in it.
+
+    ``base`` (key -> rev last seen on disk) and ``dirty`` (key -> rev of
+    the local edit) are updated to match.
+    """
+    changed = set()
+    for key in set(disk) | set(base):
+        theirs = disk.get(key)
+        disk_rev = rev_of(theirs) if theirs is not None else None
+        if disk_rev == base.get(key):
+            continue  # not changed on disk since we last looked
+
+        if key in dirty and dirty[key] >= (disk_rev or 0):
+            pass  # our newer edit stays, to be written by the next commit
+        else:
+            dirty.pop(key, None)
+            if theirs is None:
+                if records.pop(key, None) is not None:
+                    changed.add(key)
+            elif records.get(key) != theirs:
+                records[key] = theirs
+                changed.add(key)
+
+        if disk_rev is None:
+            base.pop(key, None)
+        else:
+            base[key] = disk_rev
+    return changed
+
+
+def rev_of(record):
+    # Records written before stamps existed count as revision 0
+    return record.get(REV, 0) if isinstance(record, dict) else 0
+
+
+class Inotify:
+    """Linux inotify on the directory holding some files, through ctypes.
+
+    Watching the directory, rather than the file, keeps working when a
+    save renames a new file into place. ``fileno()`` can be handed to an
+    event loop; ``read()`` returns the names written, moved in or deleted
+    since the last call. ``Inotify.open(paths)`` returns None where inotify
+    is not available.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    HEADER = 16  # struct inotify_event before its name
+
+    def __init__(self, fd, names):
+        self._fd = fd
+        self.names = names
+
+    @classmethod
+    def open(cls, paths):
+        if not sys.platform.startswith("linux"):
+            return None
+        import ctypes
+        import ctypes.util
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(cls.IN_NONBLOCK | cls.IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+
+        mask = cls.IN_CLOSE_WRITE | cls.IN_MOVED_TO | cls.IN_CREATE | cls.IN_DELETE
+        directories = {os.path.dirname(os.path.abspath(p)) for p in paths}
+        for directory in directories:
+            if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+                os.close(fd)
+                return None
+        return cls(fd, {os.path.basename(p) for p in paths})
+
+    def fileno(self):
+        return self._fd
+
+    def read(self):
+        """Names of watched files touched since the last call (never blocks)."""
+        touched = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return touched
+            if not data:
+                return touched
+            offset = 0
+            while offset < len(data):
+                length = int.from_bytes(data[offset + 12:offset + 16], sys.byteorder)
+                raw = data[offset + self.HEADER:offset + self.HEADER + length]
+                name = os.fsdecode(raw.rstrip(b"\0"))
+                if name in self.names:
+                    touched.add(name)
+                offset += self.HEADER + length
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,646 @@
+"""Task stores for the Linux Pro Planner (LinuxCalendarApp).
+
+Tasks are grouped by day keys. Callers may pass the planner's ``"2026-1-5"``
+spelling; stores file tasks under the canonical ``"2026-01-05"`` (see
+``taskgui.core.dates``) and migrate older files on load. Each task carries
+a stable ``id`` (a string) that the GUI uses as the Treeview iid.
+Stores hand out ``PlannerTask`` records and take plain dicts in ``add``;
+JSON files keep the original dict layout.
+``JsonTaskStore`` keeps the original whole-file JSON layout;
+``ShardedTaskStore`` splits it into one JSON file per month and loads months
+as they are shown; ``SqliteTaskStore`` keeps one row per task in a local
+SQLite file so the GUI only ever reads the day or month it is showing.
+``RecurringTasks`` layers repeating tasks over any of them.
+"""
+
+import calendar
+import json
+import os
+from datetime import datetime
+
+from taskgui.core.dates import normalize_key, normalize_keys, parse_date_key
+from taskgui.core.index import EMPTY_SUMMARY, DaySummary, DaySummaryIndex
+from taskgui.core.records import PlannerTask, Status, format_time, parse_time, time_sort_key, to_json
+from taskgui.core.recurrence import OccurrenceCache, Rule
+from taskgui.core.shards import MonthShards, month_of
+from taskgui.core.storage import atomic_write_json
+
+DEFAULT_TASK = {
+    "time": "00:00",
+    "category": "General",
+    "priority": "Normal",
+    "status": "Pending",
+}
+
+
+def normalize_task(task):
+    """Fill in fields missing from legacy records."""
+    for field, value in DEFAULT_TASK.items():
+        if field not in task:
+            task[field] = value
+    return task
+
+
+def sort_key(task):
+    # Pending first, then by time; "Done" tasks drop to the bottom
+    return (task.status == Status.DONE, time_sort_key(task.time))
+
+
+def toggled_status(status):
+    return Status.DONE if status == Status.PENDING else Status.PENDING
+
+
+def iso_date(date_key):
+    """Convert a planner key like ``"2026-1-5"`` to ``"2026-01-05"``."""
+    return normalize_key(date_key)
+
+
+def load_json_tasks(path):
+    if os.path.exists(path):
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    return {}
+
+
+def new_task_id():
+    # uuid (and the platform module it pulls in) is only needed once a task is added
+    import uuid
+    return uuid.uuid4().hex
+
+
+class JsonTaskStore:
+    """The whole history in one dict, rewritten to ``path`` on every change.
+
+    ``by_id`` maps each task id to its ``(date_key, task)`` so selection
+    actions find their task without scanning. With a ``saver``
+    (a ``SaveCoalescer``) the rewrite happens in the background.
+    """
+
+    def __init__(self, path, saver=None):
+        self.path = path
+        self.saver = saver
+        self.tasks = load_json_tasks(path)
+        self.by_id = {}
+        self.summary = DaySummaryIndex()
+        migrated = normalize_keys(self.tasks)
+        if self._index_tasks(self.tasks) or migrated:
+            self.save()
+
+    def _index_tasks(self, tasks):
+        """Turn loaded dicts into records and index them; True if ids were assigned."""
+        migrated = False
+        for date_key, day_tasks in tasks.items():
+            records = []
+            for data in day_tasks:
+                task = PlannerTask.from_dict(data, date_key)
+                # Legacy records (and duplicated ids) get a fresh id
+                if task.id in (None, "") or task.id in self.by_id:
+                    task.id = new_task_id()
+                    migrated = True
+                self.by_id[task.id] = (date_key, task)
+                self.summary.add(date_key, task)
+                records.append(task)
+            tasks[date_key] = records
+        return migrated
+
+    def day_tasks(self, date_key):
+        day_tasks = self.tasks.get(normalize_key(date_key), [])
+        day_tasks.sort(key=sort_key)
+        return day_tasks
+
+    def day_summary(self, date_key):
+        return self.summary.get(normalize_key(date_key))
+
+    def month_days(self, year, month):
+        """Map each day of the month that has tasks to its DaySummary."""
+        busy = {}
+        prefix = f"{year:04d}-{month:02d}-"
+        for day in range(1, calendar.monthrange(year, month)[1] + 1):
+            summary = self.summary.get(f"{prefix}{day:02d}")
+            if summary.count:
+                busy[day] = summary
+        return busy
+
+    def add(self, date_key, task):
+        date_key = normalize_key(date_key)
+        task_id = self._insert(date_key, task)
+        self._changed(date_key)
+        return task_id
+
+    def add_many(self, items):
+        """Add ``(date_key, task)`` pairs with a single save; returns how many."""
+        count = 0
+        for date_key, task in items:
+            self._insert(normalize_key(date_key), task)
+            count += 1
+        if count:
+            self.save()
+        return count
+
+    def _insert(self, date_key, task):
+        task = PlannerTask.from_dict(task, date_key)
+        task.id = new_task_id()
+        self.tasks.setdefault(date_key, []).append(task)
+        self.by_id[task.id] = (date_key, task)
+        self.summary.add(date_key, task)
+        return task.id
+
+    def delete(self, task_id):
+        entry = self.by_id.pop(task_id, None)
+        if entry is None:
+            return
+        date_key, task = entry
+
+        day_tasks = self.tasks[date_key]
+        for i, t in enumerate(day_tasks):
+            if t is task:
+                del day_tasks[i]
+                break
+        self.summary.remove(date_key, task)
+
+        if not day_tasks:
+            del self.tasks[date_key]
+        self._changed(date_key)
+
+    def toggle_done(self, task_id):
+        entry = self.by_id.get(task_id)
+        if entry is None:
+            return
+        date_key, task = entry
+
+        self.summary.remove(date_key, task)
+        task.status = toggled_status(task.status)
+        self.summary.add(date_key, task)
+        self._changed(date_key)
+
+    def _changed(self, date_key):
+        self.save()
+
+    def save(self):
+        if self.saver is not None:
+            self.saver.request(self.path, self.snapshot)
+        else:
+            atomic_write_json(self.path, self.tasks, indent=4, default=to_json)
+
+    def snapshot(self):
+        # Only the day lists are copied here, on the GUI thread; the records
+        # are shared, and one edited meanwhile is saved again by its own change
+        days = {date_key: list(day_tasks) for date_key, day_tasks in self.tasks.items()}
+        return lambda: json.dumps(days, indent=4, default=to_json)
+
+    def close(self):
+        pass
+
+
+class ShardedTaskStore(JsonTaskStore):
+    """``JsonTaskStore`` over one JSON file per month (see ``MonthShards``).
+
+    Only the months the GUI touches are read, and an edit rewrites just its
+    month. ``by_id`` and ``summary`` cover the months currently in memory;
+    the month of the last ``day_tasks`` call is pinned so the selected
+    day's ids stay valid while other months come and go from the cache.
+    A legacy single-file ``legacy_path`` is split into shards on first use.
+    """
+
+    def __init__(self, directory, legacy_path=None, saver=None, cache_size=12):
+        self.path = directory
+        self.saver = saver
+        self.by_id = {}
+        self.summary = DaySummaryIndex()
+        self.tasks = MonthShards(
+            directory,
+            legacy_path=legacy_path,
+            cache_size=cache_size,
+            saver=saver,
+            indent=4,
+            default=to_json,
+            on_load=self._load_month,
+            on_evict=self._evict_month,
+        )
+
+    def _load_month(self, key, tasks):
+        if self._index_tasks(tasks):
+            # Persist the ids handed to legacy records with their month
+            self.tasks.changed(next(iter(tasks)))
+
+    def _evict_month(self, key, tasks):
+        for date_key, day_tasks in tasks.items():
+            for task in day_tasks:
+                self.by_id.pop(task.id, None)
+                self.summary.remove(date_key, task)
+
+    def day_tasks(self, date_key):
+        self.tasks.pin(*month_of(date_key))
+        return super().day_tasks(date_key)
+
+    def day_summary(self, date_key):
+        self.tasks.month(*month_of(date_key))
+        return super().day_summary(date_key)
+
+    def month_days(self, year, month):
+        self.tasks.month(year, month)
+        return super().month_days(year, month)
+
+    def add_many(self, items):
+        # Grouped by month, so each month touched is written once and while
+        # it is still in the cache; files in date order touch the fewest
+        months = {}
+        for date_key, task in items:
+            date_key = normalize_key(date_key)
+            months.setdefault(month_of(date_key), []).append((date_key, task))
+        for pairs in months.values():
+            for date_key, task in pairs:
+                self._insert(date_key, task)
+            self.tasks.changed(pairs[0][0])
+        return sum(len(pairs) for pairs in months.values())
+
+    def _changed(self, date_key):
+        self.tasks.changed(date_key)
+
+    def save(self):
+        # Every change already queued a write of its own month
+        pass
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    time TEXT NOT NULL DEFAULT '00:00',
+    task TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT 'General',
+    priority TEXT NOT NULL DEFAULT 'Normal',
+    status TEXT NOT NULL DEFAULT 'Pending'
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_date ON tasks (date, status, time);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority, status);
+
+CREATE TABLE IF NOT EXISTS day_summary (
+    date TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,
+    pending_high INTEGER NOT NULL DEFAULT 0,
+    done INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS tasks_summary_insert AFTER INSERT ON tasks BEGIN
+    INSERT OR IGNORE INTO day_summary (date) VALUES (NEW.date);
+    UPDATE day_summary SET
+        count = count + 1,
+        pending_high = pending_high + (NEW.priority = 'High' AND NEW.status != 'Done'),
+        done = done + (NEW.status = 'Done')
+    WHERE date = NEW.date;
+END;
+
+CREATE TRIGGER IF NOT EXISTS tasks_summary_delete AFTER DELETE ON tasks BEGIN
+    UPDATE day_summary SET
+        count = count - 1,
+        pending_high = pending_high - (OLD.priority = 'High' AND OLD.status != 'Done'),
+        done = done - (OLD.status = 'Done')
+    WHERE date = OLD.date;
+    DELETE FROM day_summary WHERE date = OLD.date AND count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS tasks_summary_update AFTER UPDATE ON tasks BEGIN
+    UPDATE day_summary SET
+        count = count - 1,
+        pending_high = pending_high - (OLD.priority = 'High' AND OLD.status != 'Done'),
+        done = done - (OLD.status = 'Done')
+    WHERE date = OLD.date;
+    DELETE FROM day_summary WHERE date = OLD.date AND count <= 0;
+    INSERT OR IGNORE INTO day_summary (date) VALUES (NEW.date);
+    UPDATE day_summary SET
+        count = count + 1,
+        pending_high = pending_high + (NEW.priority = 'High' AND NEW.status != 'Done'),
+        done = done + (NEW.status = 'Done')
+    WHERE date = NEW.date;
+END;
+"""
+
+BACKFILL_SUMMARY = """
+INSERT INTO day_summary (date, count, pending_high, done)
+SELECT date, COUNT(*), SUM(priority = 'High' AND status != 'Done'), SUM(status = 'Done')
+FROM tasks GROUP BY date
+"""
+
+PAD_TIMES = "UPDATE tasks SET time = '0' || time WHERE time GLOB '[0-9]:[0-5][0-9]'"
+
+COLUMNS = ("time", "task", "category", "priority", "status")
+
+
+def task_row(date_key, task):
+    """The ``tasks`` row for a task dict, with its time as zero-padded ``HH:MM``.
+
+    Rows sort on the text column, so "9:05" must be stored as "09:05"
+    to come before "10:00" as it does in the JSON stores.
+    """
+    task = normalize_task(task)
+    row = [iso_date(date_key)] + [task[c] for c in COLUMNS]
+    row[1] = format_time(parse_time(row[1]))
+    return tuple(row)
+
+
+class SqliteTaskStore:
+    """One row per task in a single SQLite file.
+
+    Dates are stored as ISO ``YYYY-MM-DD`` so a month is an index range scan,
+    and the integer row id doubles as the task id.
+    Every write is its own single-row transaction. Triggers keep the
+    ``day_summary`` table in step with ``tasks``.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        # Imported here so the JSON and shard backends start without it
+        import sqlite3
+        self.conn = sqlite3.connect(path)
+        has_summary = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'day_summary'"
+        ).fetchone()
+        self.conn.executescript(SCHEMA)
+        if not has_summary:
+            # Databases created before the summary table existed
+            with self.conn:
+                self.conn.execute(BACKFILL_SUMMARY)
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+            # Older rows kept "9:05" as typed, which sorts after "10:00"
+            with self.conn:
+                self.conn.execute(PAD_TIMES)
+                self.conn.execute("PRAGMA user_version = 1")
+
+    def is_empty(self):
+        return self.conn.execute("SELECT 1 FROM tasks LIMIT 1").fetchone() is None
+
+    def day_tasks(self, date_key):
+        rows = self.conn.execute(
+            "SELECT CAST(id AS TEXT), time, task, category, priority, status FROM tasks"
+            " WHERE date = ? ORDER BY status = 'Done', time, id",
+            (iso_date(date_key),),
+        )
+        day = parse_date_key(date_key)
+        return [
+            PlannerTask(text, time, category, priority, status, id=task_id, date=day)
+            for task_id, time, text, category, priority, status in rows
+        ]
+
+    def day_summary(self, date_key):
+        row = self.conn.execute(
+            "SELECT count, pending_high, done FROM day_summary WHERE date = ?",
+            (iso_date(date_key),),
+        ).fetchone()
+        return DaySummary(*row) if row else EMPTY_SUMMARY
+
+    def month_days(self, year, month):
+        """Map each day of the month that has tasks to its DaySummary."""
+        last = calendar.monthrange(year, month)[1]
+        rows = self.conn.execute(
+            "SELECT date, count, pending_high, done FROM day_summary"
+            " WHERE date BETWEEN ? AND ? AND count > 0",
+            (f"{year:04d}-{month:02d}-01", f"{year:04d}-{month:02d}-{last:02d}"),
+        )
+        return {int(iso[8:]): DaySummary(*counts) for iso, *counts in rows}
+
+    def add(self, date_key, task):
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO tasks (date, time, task, category, priority, status)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                task_row(date_key, dict(task)),
+            )
+        return str(cursor.lastrowid)
+
+    def add_many(self, items):
+        """Add ``(date_key, task)`` pairs in one transaction; returns how many."""
+        rows = [task_row(date_key, dict(task)) for date_key, task in items]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO tasks (date, time, task, category, priority, status)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def delete(self, task_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM tasks WHERE id = ?", (int(task_id),))
+
+    def toggle_done(self, task_id):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE tasks SET status = CASE status WHEN 'Pending' THEN 'Done'"
+                " ELSE 'Pending' END WHERE id = ?",
+                (int(task_id),),
+            )
+
+    def import_json(self, json_path):
+        """Copy every task from a planner JSON file in one transaction."""
+        tasks = load_json_tasks(json_path)
+        rows = (
+            task_row(date_key, t)
+            for date_key, day_tasks in tasks.items()
+            for t in day_tasks
+        )
+        with self.conn:
+            cursor = self.conn.executemany(
+                "INSERT INTO tasks (date, time, task, category, priority, status)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return cursor.rowcount
+
+    def close(self):
+        self.conn.close()
+
+
+class TaskSeries:
+    """A repeating task: a template task, its first day and a ``Rule``.
+
+    ``done`` holds the dates whose occurrence was marked done.
+    """
+
+    __slots__ = ("task", "start", "rule", "done")
+
+    def __init__(self, task, start, rule, done=()):
+        self.task = task
+        self.start = start
+        self.rule = rule
+        self.done = set(done)
+
+    @classmethod
+    def from_dict(cls, series_id, data):
+        task = PlannerTask.from_dict(data["task"])
+        task.id = series_id
+        start = datetime.combine(parse_date_key(data["date"]), datetime.min.time())
+        done = (parse_date_key(d) for d in data.get("done", ()))
+        return cls(task, start, Rule.from_dict(data["repeat"]), done)
+
+    def to_dict(self):
+        task = self.task.to_dict()
+        del task["id"], task["status"]
+        return {
+            "date": self.start.date().isoformat(),
+            "task": task,
+            "repeat": self.rule.to_dict(),
+            "done": sorted(d.isoformat() for d in self.done),
+        }
+
+    def occurrence(self, day):
+        """The task as shown on ``day``, with that day's status."""
+        task = self.task
+        status = Status.DONE if day in self.done else Status.PENDING
+        return PlannerTask(task.text, format_time(task.time), task.category, task.priority,
+                           status, id=task.id, date=day)
+
+
+class RecurringTasks:
+    """Recurring tasks layered over another task store.
+
+    Each series is stored once in a small JSON file at ``path`` and shown on
+    every day it occurs; occurrences are expanded a month at a time through
+    an ``OccurrenceCache``, which every edit invalidates. Marking an
+    occurrence done only affects its day, and ``skip`` adds a day to the
+    rule's exceptions. One-off tasks go to ``base`` unchanged.
+    """
+
+    def __init__(self, base, path, saver=None):
+        self.base = base
+        self.path = path
+        self.saver = saver
+        self.series = {}  # id -> TaskSeries
+        self.occurrences = OccurrenceCache()
+        for series_id, data in load_json_tasks(path).items():
+            self._set(series_id, TaskSeries.from_dict(series_id, data))
+
+    def is_recurring(self, task_id):
+        return task_id in self.series
+
+    def day_tasks(self, date_key):
+        day_tasks = self.base.day_tasks(date_key)
+        day = parse_date_key(date_key)
+        occurring = self.occurrences.on_day(day)
+        if not occurring:
+            return day_tasks
+        day_tasks = list(day_tasks) + [self.series[i].occurrence(day) for i in occurring]
+        day_tasks.sort(key=sort_key)
+        return day_tasks
+
+    def day_summary(self, date_key):
+        day = parse_date_key(date_key)
+        summary = self.base.day_summary(date_key)
+        for series_id in self.occurrences.on_day(day):
+            summary = _plus(summary, self.series[series_id].occurrence(day))
+        return summary
+
+    def month_days(self, year, month):
+        """Map each day of the month that has tasks to its DaySummary."""
+        busy = self.base.month_days(year, month)
+        for day, occurring in self.occurrences.month(year, month).items():
+            on_day = datetime(year, month, day).date()
+            for series_id in occurring:
+                busy[day] = _plus(busy.get(day, EMPTY_SUMMARY), self.series[series_id].occurrence(on_day))
+        return busy
+
+    def add(self, date_key, task, rule=None):
+        if rule is None:
+            return self.base.add(date_key, task)
+        record = PlannerTask.from_dict(task)
+        record.id = new_task_id()
+        start = datetime.combine(parse_date_key(date_key), datetime.min.time())
+        self._set(record.id, TaskSeries(record, start, rule))
+        self.save()
+        return record.id
+
+    def add_many(self, items):
+        # Imported tasks are one-off
+        return self.base.add_many(items)
+
+    def delete(self, task_id):
+        if task_id not in self.series:
+            return self.base.delete(task_id)
+        del self.series[task_id]
+        self.occurrences.discard(task_id)
+        self.save()
+
+    def skip(self, task_id, date_key):
+        """Remove one occurrence of a series."""
+        series = self.series.get(task_id)
+        if series is None:
+            return
+        day = parse_date_key(date_key)
+        series.rule.exceptions.add(day)
+        series.done.discard(day)
+        self.occurrences.invalidate()
+        self.save()
+
+    def toggle_done(self, task_id, date_key=None):
+        series = self.series.get(task_id)
+        if series is None:
+            return self.base.toggle_done(task_id)
+        if date_key is None:
+            return
+        series.done ^= {parse_date_key(date_key)}
+        self.save()
+
+    def save(self):
+        if self.saver is not None:
+            self.saver.request(self.path, self.snapshot)
+        else:
+            atomic_write_json(self.path, self._series_dicts(), indent=4)
+
+    def snapshot(self):
+        series = self._series_dicts()
+        return lambda: json.dumps(series, indent=4)
+
+    def close(self):
+        self.base.close()
+
+    def _set(self, series_id, series):
+        self.series[series_id] = series
+        self.occurrences.set(series_id, series.start, series.rule)
+
+    def _series_dicts(self):
+        return {series_id: series.to_dict() for series_id, series in self.series.items()}
+
+
+def _plus(summary, task):
+    done = task.status == Status.DONE
+    return DaySummary(
+        summary.count + 1,
+        summary.pending_high + (task.priority == "High" and not done),
+        summary.done + done,
+    )
+
+
+def open_task_store(backend, json_path, db_path, saver=None, shard_dir=None, series_path=None):
+    """Open the configured backend, importing the JSON file into a new database.
+
+    ``"shards"`` keeps one JSON file per month in ``shard_dir`` (split from
+    ``json_path`` the first time). ``saver`` only applies to the JSON
+    files; SQLite writes are already single-row transactions. With
+    ``series_path`` the store also handles recurring tasks.
+    """
+    if backend == "sqlite":
+        store = SqliteTaskStore(db_path)
+        if store.is_empty() and os.path.exists(json_path):
+            store.import_json(json_path)
+    elif backend == "shards":
+        store = ShardedTaskStore(shard_dir, legacy_path=json_path, saver=saver)
+    else:
+        store = JsonTaskStore(json_path, saver)
+    if series_path is not None:
+        store = RecurringTasks(store, series_path, saver)
+    return store
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m taskgui.core.taskstore PLANNER.json PLANNER.db")
+
+    store = SqliteTaskStore(sys.argv[2])
+    print(f"Imported {store.import_json(sys.argv[1])} tasks into {sys.argv[2]}")
+    store.close()
@@ -0,0 +1,127 @@
+"""The TaskEase task list, without any widgets.
+
+``TodoList`` owns the tasks and every index over them. Positions
+(0-based, in insertion order) are what the GUI shows and what the edit
+methods take; each task also has a stable id used by the search index.
+Ids only grow and tasks are only appended, so the id list stays sorted and
+ids map back to positions by bisection.
+"""
+
+import itertools
+import json
+from bisect import bisect_left
+
+from taskgui.core.index import TitleIndex
+from taskgui.core.records import TodoItem, to_json
+from taskgui.core.search import SearchIndex
+
+
+class TodoList:
+
+    def __init__(self, tasks=()):
+        self.search_index = SearchIndex()
+        # Normalized titles for duplicate checks
+        self.title_index = TitleIndex(casefold=True, collapse_whitespace=True, unicode_form="NFKC")
+        self.reset(tasks)
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def __getitem__(self, index):
+        return self.tasks[index]
+
+    def reset(self, tasks):
+        self.tasks = list(tasks)
+        self.ids = list(range(len(self.tasks)))
+        self._next_id = itertools.count(len(self.tasks))
+        self.search_index.rebuild(
+            (task_id, t.title, t.note) for task_id, t in zip(self.ids, self.tasks)
+        )
+        self.title_index.rebuild(t.title for t in self.tasks)
+
+    def valid(self, index):
+        return 0 <= index < len(self.tasks)
+
+    def add(self, title, note=""):
+        return self._append(TodoItem(title, note))
+
+    def add_many(self, items):
+        """Append TodoItems whose titles are not taken yet; returns how many."""
+        first = len(self.tasks)
+        for task in items:
+            if task.title not in self.title_index:
+                self._append(task, index=False)
+        # One vocabulary merge for the batch instead of one insert per token
+        self.search_index.add_many(
+            (self.ids[i], self.tasks[i].title, self.tasks[i].note)
+            for i in range(first, len(self.tasks))
+        )
+        return len(self.tasks) - first
+
+    def edit(self, index, title, note=""):
+        task = self.tasks[index]
+        self.title_index.remove(task.title)
+        self.title_index.add(title)
+        task.title = title
+        task.note = note
+        self.search_index.update(self.ids[index], title, note)
+        return task
+
+    def delete(self, index):
+        task = self.tasks.pop(index)
+        self.search_index.remove(self.ids.pop(index))
+        self.title_index.remove(task.title)
+        return task
+
+    def mark_done(self, index):
+        task = self.tasks[index]
+        task.done = True
+        return task
+
+    def is_duplicate(self, title):
+        return title in self.title_index
+
+    # ---- queries; each returns task positions ----
+
+    def all(self):
+        return range(len(self.tasks))
+
+    def done(self):
+        return [i for i, t in enumerate(self.tasks) if t.done]
+
+    def not_done(self):
+        return [i for i, t in enumerate(self.tasks) if not t.done]
+
+    def search(self, query):
+        """Positions of tasks matching every word prefix in ``query``, in order."""
+        matches = self.search_index.search(query)
+        if matches is None:
+            return self.all()
+        return [bisect_left(self.ids, task_id) for task_id in sorted(matches)]
+
+    def statistics(self):
+        """``(total, done, not_done)``."""
+        done = sum(1 for t in self.tasks if t.done)
+        return len(self.tasks), done, len(self.tasks) - done
+
+    # ---- JSON boundary ----
+
+    def load(self, path):
+        """Replace the tasks with those in ``path``; FileNotFoundError is passed on."""
+        with open(path, "r") as f:
+            self.reset(TodoItem.from_dict(t) for t in json.load(f))
+
+    def snapshot(self):
+        # A copy of the list for the writer thread to serialize
+        tasks = list(self.tasks)
+        return lambda: json.dumps(tasks, default=to_json)
+
+    # ---- internals ----
+
+    def _append(self, task, index=True):
+        self.tasks.append(task)
+        self.ids.append(next(self._next_id))
+        if index:
+            self.search_index.add(self.ids[-1], task.title, task.note)
+        self.title_index.add(task.title)
+        return task
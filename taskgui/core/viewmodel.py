@@ -0,0 +1,160 @@
+"""Row diffing for list views, independent of the widget that shows them.
+
+A view is an ordered list of ``(iid, values)`` rows. ``diff_rows`` turns the
+rows currently displayed and the rows wanted into the smallest sequence of
+widget operations the Treeview understands:
+
+* ``("delete", iids)``     -- remove rows that are gone
+* ``("detach", iids)``     -- unhook rows that have to change position
+* ``("insert", index, iid, values)``
+* ``("move", index, iid)`` -- re-attach a detached row at ``index``
+* ``("update", iid, values)``
+
+Applied in order, they leave the widget showing exactly the wanted rows.
+Rows that keep their relative order (the longest increasing subsequence of
+old positions) are never touched, so moving one task costs one operation.
+"""
+
+from bisect import bisect_left
+
+
+def _longest_increasing(seq):
+    """Return the indexes into ``seq`` of one longest increasing subsequence."""
+    tails = []      # tails[k] = smallest tail value of an increasing run of length k+1
+    tail_idx = []   # index into seq of that tail
+    prev = [-1] * len(seq)
+
+    for i, value in enumerate(seq):
+        k = bisect_left(tails, value)
+        if k == len(tails):
+            tails.append(value)
+            tail_idx.append(i)
+        else:
+            tails[k] = value
+            tail_idx[k] = i
+        prev[i] = tail_idx[k - 1] if k else -1
+
+    result = []
+    i = tail_idx[-1] if tail_idx else -1
+    while i != -1:
+        result.append(i)
+        i = prev[i]
+    result.reverse()
+    return result
+
+
+def _common_prefix(a, b):
+    """Length of the common prefix of two lists, compared in C-speed slices."""
+    n = min(len(a), len(b))
+    i = 0
+    step = 512
+    while i < n:
+        j = min(i + step, n)
+        if a[i:j] != b[i:j]:
+            break
+        i = j
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _common_suffix(a, b, limit):
+    """Length of the common suffix of two lists, at most ``limit``."""
+    la, lb = len(a), len(b)
+    i = 0
+    step = 512
+    while i < limit:
+        j = min(i + step, limit)
+        if a[la - j:la - i] != b[lb - j:lb - i]:
+            break
+        i = j
+    while i < limit and a[la - i - 1] == b[lb - i - 1]:
+        i += 1
+    return i
+
+
+def _stable_rows(current, wanted):
+    """Rows of ``wanted`` that can stay where they are in ``current``.
+
+    Both lists hold the same iids; only the order differs.
+    """
+    start = _common_prefix(current, wanted)
+    if start == len(current):
+        return set(current)
+    end = len(current) - _common_suffix(current, wanted, len(current) - start)
+
+    stable = set(current[:start])
+    stable.update(current[end:])
+
+
+    position = {iid: i for i, iid in enumerate(current[start:end])}
+    middle = wanted[start:end]
+    seq = [position[iid] for iid in middle]
+    stable.update(middle[i] for i in _longest_increasing(seq))
+    return stable
+
+
+def _single_move(old_rows, new_rows, offset):
+    """Ops for the common "one row changed position" edit, or None.
+
+    Re-sorting after a status toggle moves one row to the other end of the
+    differing span; spotting that with slice comparisons avoids building
+    lookup tables over the whole span.
+    """
+    if len(old_rows) != len(new_rows) or len(old_rows) < 2:
+        return None
+
+    if old_rows[0][0] == new_rows[-1][0] and old_rows[1:] == new_rows[:-1]:
+        (iid, old_values), new_values = old_rows[0], new_rows[-1][1]
+        index = offset + len(new_rows) - 1
+    elif old_rows[-1][0] == new_rows[0][0] and old_rows[:-1] == new_rows[1:]:
+        (iid, old_values), new_values = old_rows[-1], new_rows[0][1]
+        index = offset
+    else:
+        return None
+
+    ops = [("detach", [iid]), ("move", index, iid)]
+    if old_values != new_values:
+        ops.append(("update", iid, new_values))
+    return ops
+
+
+def diff_rows(old_rows, new_rows):
+    """Return the operations that turn ``old_rows`` into ``new_rows``."""
+    # Identical leading and trailing rows need no work at all
+    start = _common_prefix(old_rows, new_rows)
+    limit = min(len(old_rows), len(new_rows)) - start
+    end = _common_suffix(old_rows, new_rows, limit)
+    old_rows = old_rows[start:len(old_rows) - end]
+    new_rows = new_rows[start:len(new_rows) - end]
+
+    moved = _single_move(old_rows, new_rows, start)
+    if moved is not None:
+        return moved
+
+    old_values = dict(old_rows)
+    new_iids = {iid for iid, _ in new_rows}
+    ops = []
+
+    deleted = [iid for iid, _ in old_rows if iid not in new_iids]
+    if deleted:
+        ops.append(("delete", deleted))
+
+    current = [iid for iid, _ in old_rows if iid in new_iids]
+    wanted = [iid for iid, _ in new_rows if iid in old_values]
+    stable = _stable_rows(current, wanted)
+
+    moved = [iid for iid in wanted if iid not in stable]
+    if moved:
+        ops.append(("detach", moved))
+
+    for index, (iid, values) in enumerate(new_rows, start):
+        if iid not in old_values:
+            ops.append(("insert", index, iid, values))
+            continue
+        if iid not in stable:
+            ops.append(("move", index, iid))
+        if old_values[iid] != values:
+            ops.append(("update", iid, values))
+
+    return ops
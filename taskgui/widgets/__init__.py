@@ -0,0 +1,38 @@
+"""Reusable Tk widgets for the calendar and task manager GUIs.
+
+Names are imported from their submodules on first use, so importing
+one submodule (or the package) does not load all the others.
+"""
+
+import importlib
+
+# name -> submodule defining it
+_EXPORTS = {
+    "CalendarGrid": "calendar_grid",
+    "ImportDialog": "import_dialog",
+    "LiveSync": "live_sync",
+    "TreeviewSync": "tree_sync",
+    "VirtualListbox": "virtual_list",
+    "VirtualTreeview": "virtual_list",
+}
+
+__all__ = [
+    "CalendarGrid",
+    "ImportDialog",
+    "LiveSync",
+    "TreeviewSync",
+    "VirtualListbox",
+    "VirtualTreeview",
+]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
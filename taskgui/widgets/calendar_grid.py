@@ -0,0 +1,99 @@
+"""A month view built from one fixed pool of day buttons."""
+
+import calendar
+import tkinter as tk
+
+ROWS = 6
+COLUMNS = 7
+
+
+class CalendarGrid:
+    """6x7 day buttons created once and reconfigured on every month change.
+
+    ``show(year, month, style)`` writes the day numbers into the pool, hides
+    the cells outside the month with ``grid_remove`` and only calls
+    ``configure`` on buttons whose options actually changed, so navigating
+    months never creates or destroys widgets.
+
+    ``style(day)`` may return extra button options (``bg``, ``fg``, ...) for
+    a day; any option it leaves out falls back to the button's default.
+    Clicking a day calls ``command(day)``.
+    """
+
+    def __init__(self, parent, command, first_row=1, button_options=None, grid_options=None):
+        self.command = command
+        self.year = None
+        self.month = None
+        self.days = [0] * (ROWS * COLUMNS)
+        self.buttons = []
+        self._applied = []
+        self._visible = []
+
+        for i in range(ROWS * COLUMNS):
+            row, col = divmod(i, COLUMNS)
+            btn = tk.Button(parent, command=lambda i=i: self._on_click(i), **(button_options or {}))
+            btn.grid(row=first_row + row, column=col, **(grid_options or {}))
+            btn.grid_remove()
+            self.buttons.append(btn)
+            self._applied.append({})
+            self._visible.append(False)
+
+        self.defaults = {
+            "bg": self.buttons[0].cget("bg"),
+            "fg": self.buttons[0].cget("fg"),
+        }
+
+    def show(self, year, month, style=None):
+        self.year = year
+        self.month = month
+        weeks = calendar.monthcalendar(year, month)
+
+        for i, btn in enumerate(self.buttons):
+            row, col = divmod(i, COLUMNS)
+            day = weeks[row][col] if row < len(weeks) else 0
+            self.days[i] = day
+
+            if day == 0:
+                if self._visible[i]:
+                    btn.grid_remove()
+                    self._visible[i] = False
+                continue
+
+            self._style(i, day, style)
+
+            if not self._visible[i]:
+                btn.grid()
+                self._visible[i] = True
+
+    def refresh(self, style=None):
+        """Re-apply ``style`` to the month currently shown."""
+        if self.year is not None:
+            self.show(self.year, self.month, style)
+
+    def restyle(self, days, style=None):
+        """Re-apply ``style`` to just the given days of the month shown."""
+        for i, day in enumerate(self.days):
+            if day and day in days:
+                self._style(i, day, style)
+
+    def _style(self, i, day, style):
+        btn = self.buttons[i]
+        options = dict(self.defaults, text=str(day))
+        if style is not None:
+            extra = style(day) or {}
+            for key in extra:
+                if key not in self.defaults:
+                    # First time this option is styled: remember the default
+                    self.defaults[key] = btn.cget(key)
+            options.update(extra)
+
+        applied = self._applied[i]
+        changed = {k: v for k, v in options.items() if applied.get(k) != v}
+        if changed:
+            btn.configure(**changed)
+            applied.update(changed)
+
+    def _on_click(self, index):
+        day = self.days[index]
+        if day:
+            self.command(day)
@@ -0,0 +1,81 @@
+"""One shared wall-clock timer for everything that depends on the time.
+
+``Clock(root)`` keeps a single ``after()`` job that fires just past each
+wall-clock second boundary: the delay is worked out from the current
+time on every tick, so it does not drift or skip seconds the way a fixed
+``after(1000)`` after some work does.
+
+On every tick it:
+
+- sets each ``StringVar`` bound with ``show(var, fmt)``, but only when
+  the formatted text changed;
+- calls every ``each_second(callback)`` with the tick's datetime;
+- calls every ``each_day(callback)`` when the date changed since the
+  last tick (midnight, or the machine waking up on a later day).
+"""
+
+import tkinter
+from datetime import datetime
+
+# Fire this far past the boundary so the tick never lands just before it
+SLACK_MS = 2
+
+
+class Clock:
+
+    def __init__(self, root, now=datetime.now):
+        self.root = root
+        self.now = now
+        self._labels = []       # [var, fmt, last text]
+        self._second = []
+        self._day = []
+        self._today = None
+        self._job = None
+
+    def show(self, var, fmt):
+        """Keep ``var`` set to the time formatted with ``fmt``."""
+        self._labels.append([var, fmt, None])
+        return self
+
+    def each_second(self, callback):
+        self._second.append(callback)
+        return self
+
+    def each_day(self, callback):
+        self._day.append(callback)
+        return self
+
+    def start(self):
+        self._today = self.now().date()
+        self._tick()
+        return self
+
+    def stop(self):
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except tkinter.TclError:
+                pass  # the window is already gone
+            self._job = None
+
+    # ---- internals ----
+
+    def _tick(self):
+        now = self.now()
+        # Scheduled first so a callback that opens a modal dialog (which
+        # runs a nested event loop) does not stop the clock
+        self._job = self.root.after(1000 - now.microsecond // 1000 + SLACK_MS, self._tick)
+
+        for label in self._labels:
+            text = now.strftime(label[1])
+            if text != label[2]:
+                label[0].set(text)
+                label[2] = text
+
+        if now.date() != self._today:
+            self._today = now.date()
+            for callback in self._day:
+                callback(now)
+
+        for callback in self._second:
+            callback(now)
@@ -0,0 +1,80 @@
+"""Progress window for the streaming importers in ``taskgui.core.importers``.
+
+``ImportDialog(parent, steps, on_done)`` runs one batch of ``steps`` (an
+importer generator) per ``after()`` tick, so the window keeps repainting
+while a large file goes in, and shows how far through the file it is.
+When the import ends, fails or is cancelled the window closes and
+``on_done(progress, problem)`` is called once, for the caller to refresh
+its views; ``problem`` is None after a complete import, otherwise a short
+message. Batches already written stay written.
+"""
+
+import csv
+import tkinter as tk
+from tkinter import ttk
+
+from taskgui.core.importers import ImportProgress
+
+
+class ImportDialog(tk.Toplevel):
+
+    def __init__(self, parent, steps, on_done, title="Importing"):
+        super().__init__(parent)
+        self.steps = steps
+        self.on_done = on_done
+        self.progress = ImportProgress()
+
+        self.title(title)
+        self.resizable(False, False)
+        self.transient(parent)
+
+        self.bar = ttk.Progressbar(self, length=320, maximum=1.0)
+        self.bar.pack(padx=15, pady=(15, 5))
+        self.label = ttk.Label(self, text="Reading...")
+        self.label.pack(padx=15)
+        ttk.Button(self, text="Cancel", command=self.cancel).pack(pady=10)
+
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+        self.grab_set()
+        self._job = self.after(1, self._step)
+
+    def cancel(self):
+        if self._job is not None:
+            self.after_cancel(self._job)
+        self.steps.close()
+        self._finish("Import cancelled")
+
+    # ---- internals ----
+
+    def _step(self):
+        self._job = None
+        try:
+            self.progress = next(self.steps)
+        except StopIteration:
+            self._finish(None)
+            return
+        except (OSError, csv.Error) as e:
+            self._finish(f"Import stopped: {e}")
+            return
+        except Exception as e:
+            # Not a bad file but a bug: free the window, then let Tk report it
+            self._finish(f"Import failed: {e}")
+            raise
+
+        self.bar["value"] = self.progress.fraction
+        self.label.config(text=f"{self.progress.imported} imported, {self.progress.skipped} skipped")
+        self._job = self.after(1, self._step)
+
+    def _finish(self, problem):
+        self.grab_release()
+        self.destroy()
+        self.on_done(self.progress, problem)
+
+
+def import_summary(progress, problem=None):
+    """Text for the message box shown once an import has ended."""
+    lines = [problem] if problem else []
+    lines.append(f"{progress.imported} imported, {progress.skipped} skipped.")
+    if progress.errors:
+        lines += ["", "First problems:"] + progress.errors
+    return "\n".join(lines)
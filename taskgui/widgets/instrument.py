@@ -0,0 +1,134 @@
+"""Tk hooks feeding ``taskgui.core.profiling``.
+
+Every Python callback Tk runs (button commands, ``after()`` jobs, event
+bindings, variable traces) goes through ``tkinter.CallWrapper``. While
+profiling is on, that class is swapped for one that times each call under
+the name of the function it wraps. Widgets register their callbacks when
+they are created, so profiling has to start before the first widget.
+
+Main-loop stalls are found by a ``Heartbeat``: an ``after()`` job every
+``HEARTBEAT_MS`` that records how late it ran. It starts with
+``mainloop()``.
+
+    with profile_session():
+        app = CalendarApp()
+        app.mainloop()
+"""
+
+import time
+import tkinter
+from contextlib import contextmanager
+
+from taskgui.core.profiling import Profiler, requested
+
+HEARTBEAT_MS = 50
+# Lateness below this is Tk's normal scheduling jitter, not a stall
+STALL_MS = 30
+
+_CallWrapper = tkinter.CallWrapper
+_mainloop = tkinter.Misc.mainloop
+
+
+def handler_name(func):
+    """``(name, kind)`` for a registered callback, or None to leave it untimed."""
+    kind = "handler"
+    # after() registers a closure around the real callback
+    if getattr(func, "__qualname__", "").endswith("after.<locals>.callit"):
+        kind = "after"
+        func = next(c.cell_contents for c in func.__closure__ if callable(c.cell_contents))
+    func = getattr(func, "__func__", func)
+    if func is Heartbeat._tick:
+        return None
+    name = getattr(func, "__qualname__", type(func).__name__)
+    return name.replace("<locals>.", ""), kind
+
+
+class Heartbeat:
+
+    def __init__(self, root, profiler, interval_ms=HEARTBEAT_MS, stall_ms=STALL_MS):
+        self.root = root
+        self.profiler = profiler
+        self.interval_ms = interval_ms
+        self.stall_ms = stall_ms
+        self._expected = None
+        self._job = None
+
+    def start(self):
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._job = self.root.after(self.interval_ms, self._tick)
+
+    def stop(self):
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except tkinter.TclError:
+                pass  # the window is already gone
+            self._job = None
+
+    def _tick(self):
+        now = time.perf_counter()
+        if (now - self._expected) * 1000 >= self.stall_ms:
+            self.profiler.stall(self._expected, now)
+        self.start()
+
+
+def install(profiler):
+    """Route Tk callbacks created from now on through ``profiler``."""
+
+    class TimedCallWrapper(_CallWrapper):
+
+        def __init__(self, func, subst, widget):
+            super().__init__(func, subst, widget)
+            self.label = handler_name(func)
+
+        def __call__(self, *args):
+            if self.label is None:
+                return super().__call__(*args)
+            start = time.perf_counter()
+            try:
+                return super().__call__(*args)
+            finally:
+                profiler.record(self.label[0], start, time.perf_counter(), self.label[1])
+
+    def mainloop(widget, n=0):
+        heartbeat = Heartbeat(widget._root(), profiler)
+        heartbeat.start()
+        try:
+            _mainloop(widget, n)
+        finally:
+            heartbeat.stop()
+
+    tkinter.CallWrapper = TimedCallWrapper
+    tkinter.Misc.mainloop = mainloop
+
+
+def uninstall():
+    tkinter.CallWrapper = _CallWrapper
+    tkinter.Misc.mainloop = _mainloop
+
+
+def start_profiling(argv=None, environ=None):
+    """Start profiling if it was asked for; returns the Profiler or None."""
+    path = requested(argv, environ)
+    if path is None:
+        return None
+    profiler = Profiler(path or None)
+    install(profiler)
+    profiler.start()
+    return profiler
+
+
+def stop_profiling(profiler):
+    if profiler is None:
+        return
+    uninstall()
+    profiler.stop()
+
+
+@contextmanager
+def profile_session(argv=None, environ=None):
+    profiler = start_profiling(argv, environ)
+    try:
+        yield profiler
+    finally:
+        stop_profiling(profiler)
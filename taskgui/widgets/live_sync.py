@@ -0,0 +1,146 @@
+"""Keeping a window's records in step with other windows on the same file.
+
+``LiveSync(root, records, on_change)`` drives a ``SyncedRecords`` (see
+``taskgui.core.sync``) from the Tk event loop:
+
+- on Linux it waits on inotify through ``createfilehandler``, so an
+  external save is picked up as soon as it lands and nothing runs while
+  the file is quiet; elsewhere the file's signature is polled every
+  ``poll_ms``;
+- ``save()`` commits after ``delay_ms`` of quiet, so a burst of edits is
+  one locked read-merge-write;
+- the locked reads and writes run on a ``PersistenceWorker``'s thread, so
+  waiting for the lock or the disk never blocks Tk; their results are
+  merged back on the Tk thread, from an ``after`` job, in the order they
+  ran;
+- ``on_change(keys)`` is called with the keys whose records another
+  process changed, for the window to redraw just those.
+"""
+
+import queue
+import tkinter
+
+from taskgui.core.persist import PersistenceWorker
+from taskgui.core.sync import Inotify
+
+POLL_MS = 1000
+SAVE_DELAY_MS = 250
+SAVE_POLL_MS = 50
+
+
+class LiveSync:
+
+    def __init__(self, root, records, on_change, report=None, poll_ms=POLL_MS,
+                 delay_ms=SAVE_DELAY_MS, worker=None):
+        self.root = root
+        self.records = records
+        self.on_change = on_change
+        self.report = report
+        self.poll_ms = poll_ms
+        self.delay_ms = delay_ms
+        self.worker = worker or PersistenceWorker()
+        self._results = queue.SimpleQueue()  # (kind, value) from the worker, in order
+        self.worker.on_error = lambda path, exc: self._results.put(("error", (path, exc)))
+        self._read_key = records.path + ".read"  # the worker's slot for reloads
+        self._notify = None
+        self._poll_job = None
+        self._save_job = None
+        self._result_job = None
+
+    def start(self):
+        self._notify = Inotify.open([self.records.path])
+        if self._notify is not None:
+            try:
+                self.root.tk.createfilehandler(self._notify, tkinter.READABLE, self._readable)
+            except (AttributeError, RuntimeError, tkinter.TclError):
+                # Tk without file handlers (e.g. on Windows): poll instead
+                self._notify.close()
+                self._notify = None
+        if self._notify is None:
+            self._poll_job = self.root.after(self.poll_ms, self._poll)
+        return self
+
+    def save(self):
+        """Commit once the current burst of edits ends."""
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+        self._save_job = self.root.after(self.delay_ms, self._commit)
+
+    def flush(self):
+        """Commit now and wait for it (an explicit save, or closing)."""
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+        self._commit()
+        self.worker.flush()
+        self._collect()
+
+    def close(self):
+        self.flush()
+        for job in (self._poll_job, self._result_job):
+            if job is not None:
+                self.root.after_cancel(job)
+        self._poll_job = self._result_job = None
+        if self._notify is not None:
+            self.root.tk.deletefilehandler(self._notify)
+            self._notify.close()
+            self._notify = None
+        self.worker.close()
+
+    # ---- internals ----
+
+    def _readable(self, fd, mask):
+        if self._notify.read():
+            self._check()
+
+    def _poll(self):
+        self._poll_job = self.root.after(self.poll_ms, self._poll)
+        self._check()
+
+    def _check(self):
+        if not self.records.changed_on_disk():
+            return
+        fetch = self.records.fetch
+        self._run(self._read_key, lambda: self._results.put(("read", fetch())))
+
+    def _commit(self):
+        self._save_job = None
+        if not self.records.pending():
+            return
+        commit = self.records.prepare()
+        self._run(self.records.path, lambda: self._results.put(("commit", commit())))
+
+    def _run(self, key, job):
+        self.worker.call(key, job)
+        if self._result_job is None:
+            self._result_job = self.root.after(SAVE_POLL_MS, self._poll_results)
+
+    def _poll_results(self):
+        self._result_job = None
+        # Check before collecting: a job that ends after the check is
+        # still picked up by the next poll
+        busy = self.worker.busy()
+        self._collect()
+        if busy:
+            self._result_job = self.root.after(SAVE_POLL_MS, self._poll_results)
+
+    def _collect(self):
+        changed = set()
+        while True:
+            try:
+                kind, value = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "commit":
+                changed |= self.records.finish(value)
+            elif kind == "read":
+                changed |= self.records.take(value)
+            else:
+                key, exc = value
+                verb = "reload" if key == self._read_key else "save"
+                self._report(f"Could not {verb} {self.records.path}: {exc}")
+        if changed:
+            self.on_change(changed)
+
+    def _report(self, message):
+        if self.report is not None:
+            self.report(message)
@@ -0,0 +1,40 @@
+"""Keep a ttk.Treeview in step with a list of rows without rebuilding it."""
+
+from taskgui.core.viewmodel import diff_rows
+
+
+class TreeviewSync:
+    """Applies only the inserts, deletes, moves and value changes a refresh needs.
+
+    The Treeview must only be changed through ``sync``/``clear`` so the
+    remembered rows match what is on screen.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.rows = []
+
+    def sync(self, rows):
+        """Show ``rows``, an ordered iterable of ``(iid, values)`` pairs."""
+        rows = [(str(iid), tuple(values)) for iid, values in rows]
+        tree = self.tree
+
+        for op in diff_rows(self.rows, rows):
+            kind = op[0]
+            if kind == "delete":
+                tree.delete(*op[1])
+            elif kind == "detach":
+                tree.detach(*op[1])
+            elif kind == "insert":
+                tree.insert("", op[1], iid=op[2], values=op[3])
+            elif kind == "move":
+                tree.move(op[2], "", op[1])
+            elif kind == "update":
+                tree.item(op[1], values=op[2])
+
+        self.rows = rows
+
+    def clear(self):
+        if self.rows:
+            self.tree.delete(*(iid for iid, _ in self.rows))
+        self.rows = []
@@ -0,0 +1,215 @@
+"""Windowed list views that only materialize the rows on screen.
+
+A virtual view shows ``count`` logical rows produced on demand by
+``row_at(index)``. Only the rows in the viewport (plus ``overscan`` rows
+below it) exist in the underlying Tk widget; scrolling re-targets that
+window and the scrollbar is driven from the logical row count, so memory
+and redraw cost do not depend on the dataset size.
+"""
+
+from taskgui.widgets.tree_sync import TreeviewSync
+
+WHEEL_ROWS = 3
+
+
+class _VirtualView:
+
+    def __init__(self, widget, scrollbar=None, overscan=2):
+        self.widget = widget
+        self.scrollbar = scrollbar
+        self.overscan = overscan
+        self.count = 0
+        self.row_at = None
+        self.first = 0
+        self.selected = None  # logical index of the selected row
+        self.keys = None      # identity of each row, if the caller gave one
+        self._shown = 0       # rows currently materialized
+
+        widget.configure(yscrollcommand=self._on_widget_scroll)
+        if scrollbar is not None:
+            scrollbar.configure(command=self.yview)
+
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", lambda event: self._scroll_by(-WHEEL_ROWS))
+        widget.bind("<Button-5>", lambda event: self._scroll_by(WHEEL_ROWS))
+        widget.bind("<Up>", lambda event: self._move_selection(-1))
+        widget.bind("<Down>", lambda event: self._move_selection(1))
+        widget.bind("<Prior>", lambda event: self._move_selection(-self.height))
+        widget.bind("<Next>", lambda event: self._move_selection(self.height))
+
+    @property
+    def height(self):
+        return int(self.widget.cget("height"))
+
+    def show(self, count, row_at, keys=None):
+        """Display ``count`` rows; ``row_at(i)`` returns the values of row ``i``.
+
+        ``keys`` is a sequence naming the item on each row. With it the
+        selection follows its item to wherever the new rows put it, and is
+        dropped if the item is not shown any more; without it the
+        selection stays on the same row number.
+        """
+        self._capture_selection()
+        if self.selected is not None and keys is not None:
+            self.selected = _find(keys, self.keys, self.selected)
+        self.keys = keys
+        self.count = count
+        self.row_at = row_at
+        if self.selected is not None and self.selected >= count:
+            self.selected = None
+        self._render()
+
+    def selection(self):
+        """Logical index of the selected row, or None."""
+        self._capture_selection()
+        return self.selected
+
+    def select(self, index):
+        self.selected = index
+        self.see(index)
+
+    def clear_selection(self):
+        self.selected = None
+        self._clear_local()
+
+    def see(self, index):
+        """Scroll just enough to make logical row ``index`` visible."""
+        height = self.height
+        if index < self.first:
+            self.first = index
+        elif index >= self.first + height:
+            self.first = index - height + 1
+        self._render()
+
+    def yview(self, *args):
+        """Scrollbar protocol (``moveto`` / ``scroll``) over the logical rows."""
+        if not args:
+            return self._fractions()
+
+        self._capture_selection()
+        if args[0] == "moveto":
+            self.first = int(float(args[1]) * self.count)
+        elif args[0] == "scroll":
+            step = self.height if args[2].startswith("page") else 1
+            self.first += int(args[1]) * step
+        self._render()
+
+    # ---- internals ----
+
+    def _fractions(self):
+        if self.count <= self.height:
+            return 0.0, 1.0
+        return self.first / self.count, min(1.0, (self.first + self.height) / self.count)
+
+    def _render(self):
+        height = self.height
+        self.first = max(0, min(self.first, self.count - height))
+        last = min(self.count, self.first + height + self.overscan)
+        self._materialize(self.first, last)
+        self._shown = last - self.first
+        self.widget.yview_moveto(0)
+
+        if self.selected is not None and self.first <= self.selected < last:
+            self._select_local(self.selected - self.first)
+        elif self.selected is None and self._selected_local() is not None:
+            # The highlight would now sit on some other item's row
+            self._clear_local()
+
+        if self.scrollbar is not None:
+            self.scrollbar.set(*self._fractions())
+
+    def _on_widget_scroll(self, first, last):
+        # The widget scrolled its own rows (e.g. clicking a half-visible
+        # row): shift the logical window instead and reset the widget.
+        shift = round(float(first) * self._shown)
+        if shift:
+            self._capture_selection()
+            self.first += shift
+            self._render()
+        elif self.scrollbar is not None:
+            self.scrollbar.set(*self._fractions())
+
+    def _on_wheel(self, event):
+        if event.delta:
+            self._scroll_by(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
+        return "break"
+
+    def _scroll_by(self, rows):
+        self._capture_selection()
+        self.first += rows
+        self._render()
+        return "break"
+
+    def _move_selection(self, rows):
+        self._capture_selection()
+        if self.count:
+            current = self.first if self.selected is None else self.selected
+            self.select(max(0, min(self.count - 1, current + rows)))
+        return "break"
+
+    def _capture_selection(self):
+        local = self._selected_local()
+        if local is not None and 0 <= local < self._shown:
+            self.selected = self.first + local
+
+
+def _find(keys, old_keys, index):
+    # Row of the item that was on row ``index`` of ``old_keys``, or None
+    if old_keys is None or index >= len(old_keys):
+        return None
+    try:
+        return keys.index(old_keys[index])
+    except ValueError:
+        return None
+
+
+class VirtualTreeview(_VirtualView):
+    """A ttk.Treeview that materializes only the visible rows.
+
+    Row iids are the logical row indexes, so rows that stay in view keep
+    their item (and selection) while scrolling.
+    """
+
+    def __init__(self, tree, scrollbar=None, overscan=2):
+        self.sync = TreeviewSync(tree)
+        super().__init__(tree, scrollbar, overscan)
+
+    def _materialize(self, first, last):
+        row_at = self.row_at
+        self.sync.sync((i, row_at(i)) for i in range(first, last))
+
+    def _selected_local(self):
+        selection = self.widget.selection()
+        if selection and selection[0].isdigit():
+            return int(selection[0]) - self.first
+        return None
+
+    def _select_local(self, local):
+        iid = str(self.first + local)
+        if self.widget.selection() != (iid,):
+            self.widget.selection_set(iid)
+        self.widget.focus(iid)
+
+    def _clear_local(self):
+        self.widget.selection_set(())
+
+
+class VirtualListbox(_VirtualView):
+    """A tk.Listbox that materializes only the visible rows."""
+
+    def _materialize(self, first, last):
+        listbox = self.widget
+        listbox.delete(0, "end")
+        listbox.insert("end", *(self.row_at(i) for i in range(first, last)))
+
+    def _selected_local(self):
+        selection = self.widget.curselection()
+        return selection[0] if selection else None
+
+    def _select_local(self, local):
+        self.widget.selection_clear(0, "end")
+        self.widget.selection_set(local)
+        self.widget.activate(local)
+
+    def _clear_local(self):
+        self.widget.selection_clear(0, "end")
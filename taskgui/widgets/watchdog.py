@@ -0,0 +1,128 @@
+"""Main-loop jank watchdog.
+
+``JankWatchdog(root)`` replaces ``root.after`` so each callback scheduled
+through it records how late it fired compared to when it was due. A
+heartbeat ``after()`` job marks the main loop as alive every
+``HEARTBEAT_MS``; a background thread that finds it silent for longer than
+``threshold_ms`` logs the main thread's stack, which is the handler that
+is blocking Tk. The thread only reads the stack, it never touches Tk.
+
+Stats are handed to ``on_stats(text)`` on the GUI thread about once a
+second, e.g. to show them in a status bar.
+"""
+
+import functools
+import logging
+import sys
+import threading
+import time
+import tkinter
+import traceback
+
+from taskgui.widgets.instrument import handler_name
+
+log = logging.getLogger(__name__)
+
+# Default for threshold_ms; pass another value where an app needs one
+JANK_THRESHOLD_MS = 200
+HEARTBEAT_MS = 100
+STATS_MS = 1000
+
+
+class JankWatchdog:
+
+    def __init__(self, root, threshold_ms=JANK_THRESHOLD_MS, on_stats=None):
+        self.root = root
+        self.threshold_ms = threshold_ms
+        self.on_stats = on_stats
+
+        self.callbacks = 0
+        self.late = {}        # handler name -> times it fired over the threshold late
+        self.worst_ms = 0.0
+        self.worst_name = None
+        self.stalls = 0
+
+        self._after = root.after
+        self._main = threading.get_ident()
+        self._beat = time.perf_counter()
+        self._last_stats = self._beat
+        self._job = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._watch, name="jank-watchdog", daemon=True)
+
+    def start(self):
+        self.root.after = self.after
+        self._job = self._after(HEARTBEAT_MS, self._heartbeat)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.root.__dict__.pop("after", None)
+        if self._job is not None:
+            try:
+                self.root.after_cancel(self._job)
+            except tkinter.TclError:
+                pass  # the window is already gone
+            self._job = None
+
+    def after(self, ms, func=None, *args):
+        """``root.after`` that measures how late ``func`` fires."""
+        if func is None:
+            return self._after(ms)
+        label = handler_name(func)
+        if label is None:
+            # The profiler's own heartbeat is left as it is
+            return self._after(ms, func, *args)
+        name = label[0]
+        # after_idle() comes through here with ms == "idle"
+        due = time.perf_counter() + (ms / 1000 if ms != "idle" else 0)
+
+        # Keeps func's name for the profiler
+        @functools.wraps(func)
+        def fire():
+            self._fired(name, (time.perf_counter() - due) * 1000)
+            func(*args)
+        return self._after(ms, fire)
+
+    def summary(self):
+        late = sum(self.late.values())
+        text = f"{late}/{self.callbacks} callbacks late, {self.stalls} stalls"
+        if self.worst_name is not None:
+            text += f", worst {self.worst_ms:.0f} ms ({self.worst_name})"
+        return text
+
+    # ---- internals ----
+
+    def _fired(self, name, late_ms):
+        self.callbacks += 1
+        if late_ms < self.threshold_ms:
+            return
+        self.late[name] = self.late.get(name, 0) + 1
+        if late_ms > self.worst_ms:
+            self.worst_ms, self.worst_name = late_ms, name
+        log.warning("%s fired %.0f ms late", name, late_ms)
+
+    def _heartbeat(self):
+        now = time.perf_counter()
+        self._beat = now
+        if self.on_stats is not None and now - self._last_stats >= STATS_MS / 1000:
+            self._last_stats = now
+            self.on_stats(self.summary())
+        self._job = self._after(HEARTBEAT_MS, self._heartbeat)
+
+    def _watch(self):
+        reported = None
+        limit = (HEARTBEAT_MS + self.threshold_ms) / 1000
+        while not self._stop.wait(self.threshold_ms / 2000):
+            beat = self._beat
+            blocked = time.perf_counter() - beat
+            # One report per stall: the next heartbeat ends it
+            if blocked < limit or beat == reported:
+                continue
+            reported = beat
+            self.stalls += 1
+            frame = sys._current_frames().get(self._main)
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+            log.warning("Main loop blocked for over %.0f ms in:\n%s", blocked * 1000, stack)
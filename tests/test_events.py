@@ -0,0 +1,33 @@
+import json
+from datetime import datetime
+
+from taskgui.core.events import EventBook
+
+
+def test_daily_event_rings_once_for_the_days_missed(tmp_path):
+    path = tmp_path / "events.json"
+    path.write_text(json.dumps({
+        "2030-01-01 09:00": {
+            "text": "stand-up",
+            "color": "#90caf9",
+            "alerted": False,
+            "repeat": {"freq": "daily"},
+            "fired": "2030-01-08 09:00:00",  # two days before now
+        },
+    }))
+    now = datetime(2030, 1, 10, 12, 0)
+
+    book = EventBook(str(path))
+    book.load(now)
+    assert book.next_due() == datetime(2030, 1, 10, 9, 0)
+
+    assert book.fire_due(now) == ["2030-01-01 09:00"]
+    assert book.next_due() == datetime(2030, 1, 11, 9, 0)
+    assert book.fire_due(now) == []
+    book.close()
+
+    # The firing is saved, so reopening does not ring again
+    book = EventBook(str(path))
+    book.load(now)
+    assert book.next_due() == datetime(2030, 1, 11, 9, 0)
+    book.close()
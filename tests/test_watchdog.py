@@ -0,0 +1,42 @@
+from taskgui.core.profiling import Profiler
+from taskgui.widgets.instrument import Heartbeat
+from taskgui.widgets.watchdog import JankWatchdog
+
+
+class StubRoot:
+    """Just enough of a Tk root for after() jobs, run by hand."""
+
+    def __init__(self):
+        self.jobs = {}
+        self._next = 0
+
+    def after(self, ms, func=None, *args):
+        self._next += 1
+        job = f"after#{self._next}"
+        self.jobs[job] = (func, args)
+        return job
+
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+
+    def run_pending(self):
+        jobs, self.jobs = self.jobs, {}
+        for func, args in jobs.values():
+            func(*args)
+
+
+def test_watchdog_runs_with_the_profiler_heartbeat():
+    root = StubRoot()
+    watchdog = JankWatchdog(root).start()
+    try:
+        heartbeat = Heartbeat(root, Profiler())
+        heartbeat.start()
+        fired = []
+        root.after(0, fired.append, "job")
+        root.run_pending()
+        root.run_pending()
+        heartbeat.stop()
+    finally:
+        watchdog.stop()
+    assert fired == ["job"]
+    assert watchdog.callbacks == 1  # the heartbeat is not counted